@@ -0,0 +1,37 @@
+"""Add composite indexes for alert rule matching
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (is_active, user_id) supersedes the single-column is_active index
+    op.drop_index("idx_alert_rules_active", table_name="alert_rules")
+    op.create_index(
+        "ix_alert_rules_active_user", "alert_rules", ["is_active", "user_id"]
+    )
+    op.create_index(
+        "ix_alert_rules_active_attrs",
+        "alert_rules",
+        ["gender", "upper_color", "lower_color"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alert_rules_active_attrs", table_name="alert_rules")
+    op.drop_index("ix_alert_rules_active_user", table_name="alert_rules")
+    op.create_index("idx_alert_rules_active", "alert_rules", ["is_active"])
@@ -0,0 +1,42 @@
+"""Add partial indexes for unread/unacknowledged triggered alerts
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Boolean single-column indexes are superseded by the partial indexes
+    op.drop_index("idx_triggered_alerts_read", table_name="triggered_alerts")
+    op.drop_index("idx_triggered_alerts_acknowledged", table_name="triggered_alerts")
+    op.create_index(
+        "ix_triggered_alerts_rule_unread",
+        "triggered_alerts",
+        ["rule_id", "triggered_at"],
+        postgresql_where=sa.text("is_read = false"),
+    )
+    op.create_index(
+        "ix_triggered_alerts_rule_unack",
+        "triggered_alerts",
+        ["rule_id", "triggered_at"],
+        postgresql_where=sa.text("is_acknowledged = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggered_alerts_rule_unack", table_name="triggered_alerts")
+    op.drop_index("ix_triggered_alerts_rule_unread", table_name="triggered_alerts")
+    op.create_index("idx_triggered_alerts_acknowledged", "triggered_alerts", ["is_acknowledged"])
+    op.create_index("idx_triggered_alerts_read", "triggered_alerts", ["is_read"])
@@ -0,0 +1,35 @@
+"""Store triggered alert matched attributes as JSONB with a GIN index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No-op for databases built from 002; converts tables created from the ORM's JSON type
+    op.execute(
+        "ALTER TABLE triggered_alerts "
+        "ALTER COLUMN matched_attributes TYPE jsonb USING matched_attributes::jsonb"
+    )
+    op.create_index(
+        "ix_triggered_alerts_matched_gin",
+        "triggered_alerts",
+        ["matched_attributes"],
+        postgresql_using="gin",
+        postgresql_ops={"matched_attributes": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggered_alerts_matched_gin", table_name="triggered_alerts")
@@ -0,0 +1,48 @@
+"""Add stored aggregate_confidence column to attributes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mean of the available attribute confidences, 0 when none are set. Frozen
+# here rather than imported so later model edits cannot change this revision.
+AGGREGATE_CONFIDENCE_SQL = (
+    "COALESCE("
+    "(COALESCE(upper_color_confidence, 0) + COALESCE(lower_color_confidence, 0)"
+    " + COALESCE(gender_confidence, 0))"
+    " / NULLIF((upper_color_confidence IS NOT NULL)::int"
+    " + (lower_color_confidence IS NOT NULL)::int"
+    " + (gender_confidence IS NOT NULL)::int, 0),"
+    " 0)"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "attributes",
+        sa.Column(
+            "aggregate_confidence",
+            sa.Float(),
+            sa.Computed(AGGREGATE_CONFIDENCE_SQL, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_attributes_aggregate_confidence", "attributes", ["aggregate_confidence"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attributes_aggregate_confidence", table_name="attributes")
+    op.drop_column("attributes", "aggregate_confidence")
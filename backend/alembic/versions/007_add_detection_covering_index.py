@@ -0,0 +1,35 @@
+"""Add covering (video_id, timestamp_in_video) index on detections
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_det_video_ts",
+        "detections",
+        ["video_id", "timestamp_in_video"],
+        postgresql_include=[
+            "bbox_x", "bbox_y", "bbox_width", "bbox_height",
+            "detection_confidence", "person_crop_path",
+        ],
+    )
+    # Drop the standalone timestamp index to cut write amplification on inserts
+    op.drop_index("idx_detections_timestamp", table_name="detections")
+
+
+def downgrade() -> None:
+    op.create_index("idx_detections_timestamp", "detections", ["timestamp_in_video"])
+    op.drop_index("ix_det_video_ts", table_name="detections")
@@ -0,0 +1,33 @@
+"""Add functional lower() and composite indexes on attributes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_attr_upper_color_lower", "attributes", [sa.text("lower(upper_color)")])
+    op.create_index("ix_attr_lower_color_lower", "attributes", [sa.text("lower(lower_color)")])
+    op.create_index("ix_attr_gender_lower", "attributes", [sa.text("lower(gender)")])
+    op.create_index(
+        "ix_attr_det_gender_upper", "attributes", ["detection_id", "gender", "upper_color"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attr_det_gender_upper", table_name="attributes")
+    op.drop_index("ix_attr_gender_lower", table_name="attributes")
+    op.drop_index("ix_attr_lower_color_lower", table_name="attributes")
+    op.drop_index("ix_attr_upper_color_lower", table_name="attributes")
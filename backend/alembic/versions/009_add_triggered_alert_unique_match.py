@@ -0,0 +1,27 @@
+"""Make triggered alerts unique per (rule, detection)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets bulk rule matching use ON CONFLICT DO NOTHING for re-processed videos
+    op.create_unique_constraint(
+        "uq_triggered_alert_rule_detection", "triggered_alerts", ["rule_id", "detection_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_triggered_alert_rule_detection", "triggered_alerts", type_="unique")
@@ -0,0 +1,27 @@
+"""Store usernames and emails as citext
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("ALTER TABLE users ALTER COLUMN username TYPE citext")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE citext")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE varchar(100)")
+    op.execute("ALTER TABLE users ALTER COLUMN username TYPE varchar(50)")
@@ -0,0 +1,59 @@
+"""Convert low-cardinality string columns to native enums
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+gender_enum = postgresql.ENUM("male", "female", "unknown", name="gender_enum")
+role_enum = postgresql.ENUM("admin", "security_personnel", name="role_enum")
+processing_status_enum = postgresql.ENUM(
+    "uploaded", "processing", "completed", "failed", name="processing_status_enum"
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    gender_enum.create(bind, checkfirst=True)
+    role_enum.create(bind, checkfirst=True)
+    processing_status_enum.create(bind, checkfirst=True)
+
+    # lower() is not defined for enums; gender values are canonical lowercase
+    op.drop_index("ix_attr_gender_lower", table_name="attributes")
+
+    op.execute(
+        "ALTER TABLE attributes ALTER COLUMN gender TYPE gender_enum USING gender::gender_enum"
+    )
+    op.execute(
+        "ALTER TABLE alert_rules ALTER COLUMN gender TYPE gender_enum USING gender::gender_enum"
+    )
+    op.execute("ALTER TABLE users ALTER COLUMN role TYPE role_enum USING role::role_enum")
+    op.execute(
+        "ALTER TABLE videos ALTER COLUMN processing_status TYPE processing_status_enum "
+        "USING processing_status::processing_status_enum"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE videos ALTER COLUMN processing_status TYPE varchar(20)")
+    op.execute("ALTER TABLE users ALTER COLUMN role TYPE varchar(20)")
+    op.execute("ALTER TABLE alert_rules ALTER COLUMN gender TYPE varchar(20)")
+    op.execute("ALTER TABLE attributes ALTER COLUMN gender TYPE varchar(10)")
+    op.create_index("ix_attr_gender_lower", "attributes", [sa.text("lower(gender)")])
+
+    bind = op.get_bind()
+    processing_status_enum.drop(bind, checkfirst=True)
+    role_enum.drop(bind, checkfirst=True)
+    gender_enum.drop(bind, checkfirst=True)
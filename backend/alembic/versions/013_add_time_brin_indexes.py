@@ -0,0 +1,34 @@
+"""Add BRIN indexes on detection and triggered alert timestamps
+
+Revision ID: 013
+Revises: 011
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both tables are insert-ordered by time; BRIN summaries stay a few pages in size
+    op.create_index(
+        "ix_det_created_brin", "detections", ["created_at"], postgresql_using="brin"
+    )
+    op.create_index(
+        "ix_triggered_alerts_triggered_brin",
+        "triggered_alerts",
+        ["triggered_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggered_alerts_triggered_brin", table_name="triggered_alerts")
+    op.drop_index("ix_det_created_brin", table_name="detections")
@@ -0,0 +1,51 @@
+"""Make alert timestamps timezone-aware and index triggered alerts by day
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ("alert_rules", "created_at"),
+    ("alert_rules", "updated_at"),
+    ("triggered_alerts", "acknowledged_at"),
+    ("triggered_alerts", "triggered_at"),
+]
+
+
+def upgrade() -> None:
+    # Existing naive values were written with datetime.utcnow()
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+    op.create_index(
+        "ix_triggered_day",
+        "triggered_alerts",
+        [sa.text("date_trunc('day', timezone('UTC', triggered_at))")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_triggered_day", table_name="triggered_alerts")
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,29 @@
+"""Add (video_id, detection_confidence DESC) index on detections
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_det_conf_desc",
+        "detections",
+        ["video_id", sa.text("detection_confidence DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_det_conf_desc", table_name="detections")
@@ -0,0 +1,44 @@
+"""Add metrics_summary materialized view
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # View definition frozen here rather than imported from app.db.views, so
+    # later edits to the live query cannot change what this revision creates
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS metrics_summary AS
+        SELECT
+            1 AS id,
+            (SELECT count(*) FROM videos) AS total_videos,
+            (SELECT count(*) FROM detections) AS total_detections,
+            pm.average_fps,
+            pm.average_area_reduction,
+            pm.total_processing_time
+        FROM (
+            SELECT
+                avg(avg_fps) AS average_fps,
+                avg(area_reduction_percentage) AS average_area_reduction,
+                sum(processing_time_seconds) AS total_processing_time
+            FROM performance_metrics
+        ) pm
+    """)
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_metrics_summary_id ON metrics_summary (id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS metrics_summary")
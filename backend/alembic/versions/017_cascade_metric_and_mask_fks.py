@@ -0,0 +1,39 @@
+"""Add ON DELETE CASCADE to performance metric and segmentation mask FKs
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table, referred column)
+FOREIGN_KEYS = [
+    ("performance_metrics", "video_id", "videos", "video_id"),
+    ("segmentation_masks", "camera_id", "cameras", "camera_id"),
+]
+
+
+def upgrade() -> None:
+    # ORM relationships now rely on passive deletes, so the database must cascade
+    for table, column, referred_table, referred_column in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referred_table, [column], [referred_column], ondelete="CASCADE"
+        )
+
+
+def downgrade() -> None:
+    for table, column, referred_table, referred_column in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referred_table, [column], [referred_column])
@@ -0,0 +1,32 @@
+"""Replace search_history user index with (user_id, search_timestamp DESC)
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_search_hist_user_ts",
+        "search_history",
+        ["user_id", sa.text("search_timestamp DESC")],
+    )
+    # The composite index's leading column serves plain user_id lookups
+    op.drop_index("idx_search_user", table_name="search_history")
+
+
+def downgrade() -> None:
+    op.create_index("idx_search_user", "search_history", ["user_id"])
+    op.drop_index("ix_search_hist_user_ts", table_name="search_history")
@@ -0,0 +1,51 @@
+"""Add indexed search_confidence ranking column to attributes
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("attributes", sa.Column("search_confidence", sa.Float(), nullable=True))
+
+    # FR9 score spans two tables, so it cannot be a generated column; backfill once
+    op.execute("""
+        UPDATE attributes a
+        SET search_confidence = d.detection_confidence
+            * COALESCE(a.upper_color_confidence, 1.0)
+            * COALESCE(a.lower_color_confidence, 1.0)
+            * COALESCE(a.gender_confidence, 1.0)
+        FROM detections d
+        WHERE d.detection_id = a.detection_id
+    """)
+    op.alter_column("attributes", "search_confidence", nullable=False)
+
+    op.create_index("ix_attributes_search_confidence", "attributes", ["search_confidence"])
+    op.create_index(
+        "ix_attr_search_filters",
+        "attributes",
+        [
+            "gender",
+            sa.text("lower(upper_color)"),
+            sa.text("lower(lower_color)"),
+            "search_confidence",
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attr_search_filters", table_name="attributes")
+    op.drop_index("ix_attributes_search_confidence", table_name="attributes")
+    op.drop_column("attributes", "search_confidence")
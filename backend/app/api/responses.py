@@ -0,0 +1,47 @@
+"""Custom API response classes."""
+from typing import Any, Iterable, Iterator
+
+import msgspec
+from fastapi.responses import Response
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response for msgspec Struct payloads, encoded without Pydantic."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+def stream_json_object(
+    head: dict[str, Any], key: str, items: Iterable[Any], chunk_size: int = 200
+) -> Iterator[bytes]:
+    """
+    Encode ``{**head, key: [*items]}`` incrementally for a StreamingResponse.
+
+    Args:
+        head: Leading members of the object, encoded up front
+        key: Name of the array member holding the items
+        items: Items to encode, consumed lazily
+        chunk_size: Items encoded per yielded chunk
+
+    Yields:
+        Consecutive pieces of the JSON document
+    """
+    yield _encoder.encode(head)[:-1] + (b"," if head else b"") + _encoder.encode(key) + b":["
+
+    separator = b""
+    chunk: list[bytes] = []
+    for item in items:
+        chunk.append(_encoder.encode(item))
+        if len(chunk) == chunk_size:
+            yield separator + b",".join(chunk)
+            separator = b","
+            chunk = []
+    if chunk:
+        yield separator + b",".join(chunk)
+
+    yield b"]}"
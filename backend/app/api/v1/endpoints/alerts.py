@@ -5,7 +5,7 @@ automated detection alerts rather than maintaining continuous vigilance
 across multiple video feeds, reducing cognitive load and improving detection
 of relevant events.
 """
-from datetime import datetime
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_user, get_db
 from app.models import AlertRule, TriggeredAlert, User, Video
+from app.models.alert import TRIGGERED_DAY
 from app.schemas import (
     AlertRuleCreate,
     AlertRuleUpdate,
@@ -338,7 +339,7 @@ def acknowledge_alert(
     alert.is_read = True
     alert.is_acknowledged = True
     alert.acknowledged_by = current_user.user_id
-    alert.acknowledged_at = datetime.utcnow()
+    alert.acknowledged_at = func.now()
     db.commit()
 
     return {"message": "Alert acknowledged"}
@@ -418,6 +419,7 @@ def get_alert_stats(
     total_triggered = 0
     unread_alerts = 0
     unacknowledged_alerts = 0
+    triggered_by_day: dict[str, int] = {}
 
     if rule_ids:
         total_triggered = (
@@ -438,10 +440,24 @@ def get_alert_stats(
             .scalar() or 0
         )
 
+        # Daily counts for the last 30 days (served by the ix_triggered_day index)
+        daily_counts = (
+            db.query(TRIGGERED_DAY, func.count(TriggeredAlert.alert_id))
+            .filter(
+                TriggeredAlert.rule_id.in_(rule_ids),
+                TriggeredAlert.triggered_at >= func.now() - timedelta(days=30),
+            )
+            .group_by(TRIGGERED_DAY)
+            .order_by(TRIGGERED_DAY)
+            .all()
+        )
+        triggered_by_day = {day.date().isoformat(): count for day, count in daily_counts}
+
     return AlertStats(
         total_rules=total_rules,
         active_rules=active_rules,
         total_triggered=total_triggered,
         unread_alerts=unread_alerts,
         unacknowledged_alerts=unacknowledged_alerts,
+        triggered_by_day=triggered_by_day,
     )
@@ -5,7 +5,7 @@ import tempfile
 import cv2
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps import get_current_user, get_db
 from app.models import Attribute, Detection, User, Video
@@ -64,7 +64,7 @@ def get_video_detections(
     # Query detections with attributes
     detections = (
         db.query(Detection)
-        .options(joinedload(Detection.attributes))
+        .options(selectinload(Detection.attributes))
         .filter(Detection.video_id == video_id)
         .filter(Detection.detection_confidence >= min_confidence)
         .order_by(Detection.frame_number)
@@ -95,7 +95,7 @@ def get_detection(
     """
     detection = (
         db.query(Detection)
-        .options(joinedload(Detection.attributes))
+        .options(selectinload(Detection.attributes))
         .filter(Detection.detection_id == detection_id)
         .first()
     )
@@ -175,7 +175,7 @@ def get_video_detection_summary(
     # Get all detections with attributes
     detections = (
         db.query(Detection)
-        .options(joinedload(Detection.attributes))
+        .options(selectinload(Detection.attributes))
         .filter(Detection.video_id == video_id)
         .all()
     )
@@ -238,7 +238,7 @@ def get_annotated_frame(
     # Get detection with attributes
     detection = (
         db.query(Detection)
-        .options(joinedload(Detection.attributes))
+        .options(selectinload(Detection.attributes))
         .filter(Detection.detection_id == detection_id)
         .first()
     )
@@ -279,7 +279,7 @@ def get_annotated_frame(
     if show_all_detections:
         detections = (
             db.query(Detection)
-            .options(joinedload(Detection.attributes))
+            .options(selectinload(Detection.attributes))
             .filter(
                 Detection.video_id == detection.video_id,
                 Detection.frame_number == detection.frame_number,
@@ -324,6 +324,7 @@ def get_annotated_frame(
             color=box_color,
             thickness=thickness,
             label=label,
+            inplace=True,
         )
 
     # Save annotated frame to temp file
@@ -391,7 +392,7 @@ def get_frame_with_all_detections(
     # Get all detections for this frame
     detections = (
         db.query(Detection)
-        .options(joinedload(Detection.attributes))
+        .options(selectinload(Detection.attributes))
         .filter(
             Detection.video_id == video_id,
             Detection.frame_number == frame_number,
@@ -428,6 +429,7 @@ def get_frame_with_all_detections(
             color=box_color,
             thickness=2,
             label=label,
+            inplace=True,
         )
 
     # Save annotated frame
@@ -7,11 +7,12 @@ configuration problems.
 """
 from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from fastapi import APIRouter, Depends
 
 from app.api.deps import get_current_user, get_db
+from app.db.views import metrics_summary
 from app.models import Attribute, Detection, PerformanceMetric, User, Video
 from app.schemas import (
     ColorDistribution,
@@ -39,22 +40,14 @@ def get_metrics_summary(
     Returns:
         Aggregated metrics summary
     """
-    # Total videos
-    total_videos = db.query(func.count(Video.video_id)).scalar() or 0
-
-    # Total detections
-    total_detections = db.query(func.count(Detection.detection_id)).scalar() or 0
-
-    # Average FPS and processing time from performance metrics
-    metrics_stats = db.query(
-        func.avg(PerformanceMetric.avg_fps),
-        func.avg(PerformanceMetric.area_reduction_percentage),
-        func.sum(PerformanceMetric.processing_time_seconds),
-    ).first()
-
-    average_fps = metrics_stats[0] or 0.0
-    average_area_reduction = metrics_stats[1] or 0.0
-    total_processing_time = metrics_stats[2] or 0.0
+    # Precomputed by the metrics_summary materialized view (refreshed periodically)
+    summary = db.execute(select(metrics_summary)).one()
+
+    total_videos = summary.total_videos or 0
+    total_detections = summary.total_detections or 0
+    average_fps = summary.average_fps or 0.0
+    average_area_reduction = summary.average_area_reduction or 0.0
+    total_processing_time = summary.total_processing_time or 0.0
 
     return MetricsSummary(
         total_videos=total_videos,
@@ -3,32 +3,91 @@ import csv
 import io
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
+from app.api.responses import stream_json_object
+from app.db.session import SessionLocal
 from app.models import SearchHistory, User
 from app.schemas import (
     AdvancedSearchQuery,
     NaturalLanguageQuery,
     ParsedQuery,
     SearchHistoryItem,
-    SearchResponse,
+    SearchResultItem,
 )
 from app.services import get_nlp_parser, get_search_engine
 
 router = APIRouter()
 
 
-@router.post("/query", response_model=SearchResponse)
+def _save_search_history(
+    db: Session,
+    user_id: int,
+    query_text: str,
+    parsed_attributes: dict[str, Any],
+    result_count: int,
+) -> None:
+    """Record a search in the user's history."""
+    db.add(SearchHistory(
+        user_id=user_id,
+        query_text=query_text,
+        parsed_attributes=parsed_attributes,
+        result_count=result_count,
+    ))
+    db.commit()
+
+
+def _start_search_stream(**filters: Any) -> tuple[Session, Iterator[SearchResultItem], int]:
+    """
+    Start a streaming search on a session owned by the response stream.
+
+    FastAPI closes the request's get_db session before the response body is
+    sent, so rows pulled while streaming need a session of their own.
+
+    Args:
+        **filters: Keyword arguments accepted by SearchEngine.search()
+
+    Returns:
+        Tuple of (stream session, result iterator, total count)
+    """
+    stream_db = SessionLocal()
+    try:
+        results, total_count = get_search_engine(stream_db).iter_search(**filters)
+    except Exception:
+        stream_db.close()
+        raise
+    return stream_db, results, total_count
+
+
+def _encode_search_response(
+    stream_db: Session,
+    query_text: str,
+    parsed_query: ParsedQuery,
+    total_count: int,
+    results: Iterator[SearchResultItem],
+) -> Iterator[bytes]:
+    """Encode a SearchResponse as results stream in, then release the stream session."""
+    try:
+        yield from stream_json_object(
+            {"query": query_text, "parsed_attributes": parsed_query, "total_count": total_count},
+            "results",
+            results,
+        )
+    finally:
+        stream_db.close()
+
+
+@router.post("/query", response_class=StreamingResponse)
 def natural_language_search(
     query: NaturalLanguageQuery,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> SearchResponse:
+) -> StreamingResponse:
     """
     Search detections using natural language query.
 
@@ -51,9 +110,8 @@ def natural_language_search(
         raw_query=query.query,
     )
 
-    # Execute search
-    search_engine = get_search_engine(db)
-    results, total_count = search_engine.search(
+    # Execute search; rows are streamed into the response body
+    stream_db, results, total_count = _start_search_stream(
         gender=parsed.get("gender"),
         upper_color=parsed.get("upper_color"),
         lower_color=parsed.get("lower_color"),
@@ -63,29 +121,24 @@ def natural_language_search(
     )
 
     # Save to search history
-    history_entry = SearchHistory(
-        user_id=current_user.user_id,
-        query_text=query.query,
-        parsed_attributes=parsed,
-        result_count=total_count,
-    )
-    db.add(history_entry)
-    db.commit()
+    try:
+        _save_search_history(db, current_user.user_id, query.query, parsed, total_count)
+    except Exception:
+        stream_db.close()
+        raise
 
-    return SearchResponse(
-        query=query.query,
-        parsed_attributes=parsed_query,
-        total_count=total_count,
-        results=results,
+    return StreamingResponse(
+        _encode_search_response(stream_db, query.query, parsed_query, total_count, results),
+        media_type="application/json",
     )
 
 
-@router.post("/advanced", response_model=SearchResponse)
+@router.post("/advanced", response_class=StreamingResponse)
 def advanced_search(
     query: AdvancedSearchQuery,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> SearchResponse:
+) -> StreamingResponse:
     """
     Search detections using structured attribute filters.
 
@@ -97,9 +150,8 @@ def advanced_search(
     Returns:
         Search results
     """
-    # Execute search
-    search_engine = get_search_engine(db)
-    results, total_count = search_engine.search_advanced(query)
+    # Execute search; rows are streamed into the response body
+    stream_db, results, total_count = _start_search_stream(**query.model_dump())
 
     # Build query description for history
     query_parts = []
@@ -119,25 +171,26 @@ def advanced_search(
     )
 
     # Save to search history
-    history_entry = SearchHistory(
-        user_id=current_user.user_id,
-        query_text=query_text,
-        parsed_attributes={
-            "gender": query.gender,
-            "upper_color": query.upper_color,
-            "lower_color": query.lower_color,
-            "min_confidence": query.min_confidence,
-        },
-        result_count=total_count,
-    )
-    db.add(history_entry)
-    db.commit()
+    try:
+        _save_search_history(
+            db,
+            current_user.user_id,
+            query_text,
+            {
+                "gender": query.gender,
+                "upper_color": query.upper_color,
+                "lower_color": query.lower_color,
+                "min_confidence": query.min_confidence,
+            },
+            total_count,
+        )
+    except Exception:
+        stream_db.close()
+        raise
 
-    return SearchResponse(
-        query=query_text,
-        parsed_attributes=parsed_query,
-        total_count=total_count,
-        results=results,
+    return StreamingResponse(
+        _encode_search_response(stream_db, query_text, parsed_query, total_count, results),
+        media_type="application/json",
     )
 
 
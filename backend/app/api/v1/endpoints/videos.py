@@ -1,15 +1,18 @@
 """Video management API endpoints."""
 import asyncio
 import os
+import shutil
 import tempfile
 from typing import Any
 
-import cv2
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_current_user, get_db
+from app.api.responses import MsgspecJSONResponse
 from app.core.config import settings
 from app.models import Detection, User, Video
 from app.schemas import VideoResponse, VideoProcessingStatus
@@ -28,13 +31,99 @@ router = APIRouter()
 # Store for WebSocket connections (simple in-memory for demo)
 processing_status: dict[int, VideoProcessingStatus] = {}
 
+# Clip extraction uses ffmpeg stream copy when available
+FFMPEG_BINARY = shutil.which("ffmpeg")
+
+# Cap concurrent ffmpeg processes so a burst of clip requests doesn't thrash the CPU
+_clip_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+
+async def _cut_clip_ffmpeg(
+    file_path: str, clip_path: str, start_time: float, end_time: float
+) -> None:
+    """Cut a clip with ffmpeg stream copy without blocking the event loop."""
+    async with _clip_semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            FFMPEG_BINARY,
+            "-y",
+            "-loglevel", "error",
+            "-ss", f"{start_time:.3f}",
+            "-i", file_path,
+            "-t", f"{end_time - start_time:.3f}",
+            "-c", "copy",
+            clip_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+    if proc.returncode != 0:
+        tail = stderr.decode(errors="replace").strip()[-500:]
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create video clip: {tail}",
+        )
+
+
+def _cut_clip_opencv(
+    file_path: str, clip_path: str, start_time: float, end_time: float
+) -> None:
+    """Cut a clip by re-encoding frames with OpenCV (fallback without ffmpeg)."""
+    import cv2
+
+    # Leave one core for the event loop while OpenCV decodes/encodes the clip
+    cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
+
+    # Force the FFmpeg backend and let it pick a hardware decoder when available
+    cap = cv2.VideoCapture(
+        file_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if not cap.isOpened():
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Cannot open video file",
+        )
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-@router.post("/upload", response_model=VideoResponse)
+    # Create video writer
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    out = cv2.VideoWriter(clip_path, fourcc, fps, (width, height))
+
+    # Seek by time so the decoder lands on the nearest keyframe instead of
+    # decoding every frame up to an exact frame index, then read until end_time
+    end_msec = end_time * 1000.0
+    cap.set(cv2.CAP_PROP_POS_MSEC, start_time * 1000.0)
+    while cap.get(cv2.CAP_PROP_POS_MSEC) <= end_msec:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        out.write(frame)
+
+    cap.release()
+    out.release()
+
+
+async def _cut_clip(
+    file_path: str, clip_path: str, start_time: float, end_time: float
+) -> None:
+    """Cut a clip from the source video into clip_path."""
+    if FFMPEG_BINARY:
+        await _cut_clip_ffmpeg(file_path, clip_path, start_time, end_time)
+    else:
+        await run_in_threadpool(_cut_clip_opencv, file_path, clip_path, start_time, end_time)
+
+
+@router.post("/upload", response_class=MsgspecJSONResponse)
 async def upload_video(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Video:
+) -> MsgspecJSONResponse:
     """
     Upload a video file for processing.
 
@@ -85,7 +174,7 @@ async def upload_video(
         db.commit()
         db.refresh(video)
 
-        return video
+        return MsgspecJSONResponse(VideoResponse.from_orm(video))
 
     except Exception as e:
         delete_file(file_path)
@@ -114,6 +203,17 @@ async def process_video(
     Returns:
         Processing status
     """
+    # Atomically claim the video so concurrent requests can't both enqueue it
+    claimed = db.execute(
+        update(Video)
+        .where(
+            Video.video_id == video_id,
+            Video.processing_status.in_(["uploaded", "completed", "failed"]),
+        )
+        .values(processing_status="processing")
+    ).rowcount
+    db.commit()
+
     video = db.query(Video).filter(Video.video_id == video_id).first()
     if not video:
         raise HTTPException(
@@ -121,7 +221,7 @@ async def process_video(
             detail="Video not found",
         )
 
-    if video.processing_status == "processing":
+    if not claimed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Video is already being processed",
@@ -152,12 +252,12 @@ async def process_video(
     }
 
 
-@router.get("/{video_id}/status", response_model=VideoProcessingStatus)
+@router.get("/{video_id}/status", response_class=MsgspecJSONResponse)
 def get_processing_status(
     video_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> VideoProcessingStatus:
+) -> MsgspecJSONResponse:
     """
     Get current processing status for a video.
 
@@ -177,23 +277,23 @@ def get_processing_status(
         )
 
     if video_id in processing_status:
-        return processing_status[video_id]
+        return MsgspecJSONResponse(processing_status[video_id])
 
     # Return status from database
-    return VideoProcessingStatus(
+    return MsgspecJSONResponse(VideoProcessingStatus(
         video_id=video_id,
         status=video.processing_status,
         progress=100 if video.processing_status == "completed" else 0,
         total_frames=video.total_frames,
-    )
+    ))
 
 
-@router.get("/{video_id}", response_model=VideoResponse)
+@router.get("/{video_id}", response_class=MsgspecJSONResponse)
 def get_video(
     video_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-) -> Video:
+) -> MsgspecJSONResponse:
     """
     Get video details by ID.
 
@@ -211,17 +311,17 @@ def get_video(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Video not found",
         )
-    return video
+    return MsgspecJSONResponse(VideoResponse.from_orm(video))
 
 
-@router.get("", response_model=list[VideoResponse])
+@router.get("", response_class=MsgspecJSONResponse)
 def list_videos(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 50,
     status_filter: str | None = None,
-) -> list[Video]:
+) -> MsgspecJSONResponse:
     """
     List all videos with optional filtering.
 
@@ -241,7 +341,7 @@ def list_videos(
         query = query.filter(Video.processing_status == status_filter)
 
     videos = query.order_by(Video.upload_timestamp.desc()).offset(skip).limit(limit).all()
-    return videos
+    return MsgspecJSONResponse([VideoResponse.from_orm(video) for video in videos])
 
 
 @router.delete("/{video_id}")
@@ -253,6 +353,10 @@ def delete_video(
     """
     Delete a video and its associated data.
 
+    Detections, attributes, alerts and metrics are removed by the database's
+    ON DELETE CASCADE foreign keys. The route is sync, so FastAPI runs the
+    cascading delete and the file cleanup in its threadpool.
+
     Args:
         video_id: Video ID to delete
         db: Database session
@@ -268,18 +372,18 @@ def delete_video(
             detail="Video not found",
         )
 
-    # Delete video file
-    if video.file_path:
-        delete_file(video.file_path)
-
-    # Delete crops directory
+    file_path = video.file_path
     crops_dir = os.path.join(settings.UPLOAD_DIR, "crops", str(video_id))
-    delete_directory(crops_dir)
 
-    # Delete from database (cascades to detections and attributes)
-    db.delete(video)
+    # Delete from database; child tables cascade server-side
+    db.execute(delete(Video).where(Video.video_id == video_id))
     db.commit()
 
+    # Delete video file and crops directory
+    delete_directory(crops_dir)
+    if file_path:
+        delete_file(file_path)
+
     # Remove from processing status if present
     if video_id in processing_status:
         del processing_status[video_id]
@@ -287,31 +391,8 @@ def delete_video(
     return {"message": "Video deleted successfully"}
 
 
-@router.get("/{video_id}/clip/{detection_id}")
-def extract_video_clip(
-    video_id: int,
-    detection_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-    buffer_before: float = Query(3.0, ge=0, le=30, description="Seconds before detection"),
-    buffer_after: float = Query(3.0, ge=0, le=30, description="Seconds after detection"),
-) -> FileResponse:
-    """
-    FR11: Video Clip Extraction - Generate video clip containing detected person
-    with configurable buffer duration before/after detection timestamp.
-
-    Args:
-        video_id: Video ID
-        detection_id: Detection ID
-        db: Database session
-        current_user: Current authenticated user
-        buffer_before: Seconds to include before detection (default: 3.0)
-        buffer_after: Seconds to include after detection (default: 3.0)
-
-    Returns:
-        Video clip file response
-    """
-    # Verify video exists
+def _get_clip_video(db: Session, video_id: int) -> Video:
+    """Load a video for clip extraction, checking its file is still on disk."""
     video = db.query(Video).filter(Video.video_id == video_id).first()
     if not video:
         raise HTTPException(
@@ -325,7 +406,11 @@ def extract_video_clip(
             detail="Video file not found",
         )
 
-    # Verify detection exists and belongs to this video
+    return video
+
+
+def _get_clip_detection(db: Session, video_id: int, detection_id: int) -> Detection:
+    """Load a detection, checking it belongs to the video."""
     detection = (
         db.query(Detection)
         .filter(Detection.detection_id == detection_id, Detection.video_id == video_id)
@@ -336,49 +421,50 @@ def extract_video_clip(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Detection not found for this video",
         )
+    return detection
 
-    # Open source video
-    cap = cv2.VideoCapture(video.file_path)
-    if not cap.isOpened():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Cannot open video file",
-        )
 
-    # Get video properties
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    duration = total_frames / fps if fps > 0 else 0
+@router.get("/{video_id}/clip/{detection_id}")
+async def extract_video_clip(
+    video_id: int,
+    detection_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    buffer_before: float = Query(3.0, ge=0, le=30, description="Seconds before detection"),
+    buffer_after: float = Query(3.0, ge=0, le=30, description="Seconds after detection"),
+) -> FileResponse:
+    """
+    FR11: Video Clip Extraction - Generate video clip containing detected person
+    with configurable buffer duration before/after detection timestamp.
 
-    # Calculate start and end frames with buffer
-    detection_time = detection.timestamp_in_video
-    start_time = max(0, detection_time - buffer_before)
-    end_time = min(duration, detection_time + buffer_after)
+    Args:
+        video_id: Video ID
+        detection_id: Detection ID
+        db: Database session
+        current_user: Current authenticated user
+        buffer_before: Seconds to include before detection (default: 3.0)
+        buffer_after: Seconds to include after detection (default: 3.0)
+
+    Returns:
+        Video clip file response
+    """
+    # Sync Session lookups run in the threadpool, off the event loop
+    video = await run_in_threadpool(_get_clip_video, db, video_id)
+    detection = await run_in_threadpool(_get_clip_detection, db, video_id, detection_id)
 
-    start_frame = int(start_time * fps)
-    end_frame = int(end_time * fps)
+    # Calculate start and end times with buffer
+    detection_time = detection.timestamp_in_video
+    start_time = max(0.0, detection_time - buffer_before)
+    end_time = detection_time + buffer_after
+    if video.duration_seconds:
+        end_time = min(video.duration_seconds, end_time)
 
     # Create temp file for output clip
     temp_dir = tempfile.gettempdir()
     clip_filename = f"clip_{video_id}_{detection_id}.mp4"
     clip_path = os.path.join(temp_dir, clip_filename)
 
-    # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(clip_path, fourcc, fps, (width, height))
-
-    # Extract frames
-    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-    for frame_num in range(start_frame, end_frame + 1):
-        ret, frame = cap.read()
-        if not ret:
-            break
-        out.write(frame)
-
-    cap.release()
-    out.release()
+    await _cut_clip(video.file_path, clip_path, start_time, end_time)
 
     if not os.path.exists(clip_path):
         raise HTTPException(
@@ -394,7 +480,7 @@ def extract_video_clip(
 
 
 @router.get("/{video_id}/clip-by-time")
-def extract_clip_by_timerange(
+async def extract_clip_by_timerange(
     video_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -414,18 +500,7 @@ def extract_clip_by_timerange(
     Returns:
         Video clip file response
     """
-    video = db.query(Video).filter(Video.video_id == video_id).first()
-    if not video:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Video not found",
-        )
-
-    if not video.file_path or not os.path.exists(video.file_path):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Video file not found",
-        )
+    video = await run_in_threadpool(_get_clip_video, db, video_id)
 
     if start_time >= end_time:
         raise HTTPException(
@@ -433,49 +508,20 @@ def extract_clip_by_timerange(
             detail="start_time must be less than end_time",
         )
 
-    # Open source video
-    cap = cv2.VideoCapture(video.file_path)
-    if not cap.isOpened():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Cannot open video file",
-        )
-
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    duration = total_frames / fps if fps > 0 else 0
-
     # Validate time range
-    if start_time > duration or end_time > duration:
+    duration = video.duration_seconds
+    if duration and (start_time > duration or end_time > duration):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Time range exceeds video duration ({duration:.2f}s)",
         )
 
-    start_frame = int(start_time * fps)
-    end_frame = int(end_time * fps)
-
     # Create temp file for output clip
     temp_dir = tempfile.gettempdir()
     clip_filename = f"clip_{video_id}_{start_time:.0f}_{end_time:.0f}.mp4"
     clip_path = os.path.join(temp_dir, clip_filename)
 
-    # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(clip_path, fourcc, fps, (width, height))
-
-    # Extract frames
-    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-    for frame_num in range(start_frame, end_frame + 1):
-        ret, frame = cap.read()
-        if not ret:
-            break
-        out.write(frame)
-
-    cap.release()
-    out.release()
+    await _cut_clip(video.file_path, clip_path, start_time, end_time)
 
     return FileResponse(
         clip_path,
@@ -1,6 +1,5 @@
 """Application configuration settings."""
-from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -31,6 +30,20 @@ class Settings(BaseSettings):
     # Processing Settings
     DETECTION_CONFIDENCE_THRESHOLD: float = 0.6
     ATTRIBUTE_INTERVAL_FRAMES: int = 5
+    INFERENCE_BATCH_SIZE: int = 16  # Sampled frames per detector/classifier call
+    DB_INSERT_BATCH_ROWS: int = 1000  # Detections staged per bulk INSERT
+    CROP_JPEG_QUALITY: int = 95  # Person crop JPEG quality (OpenCV's default)
+    VIDEO_DECODER: str = "opencv"  # "opencv" or "torchcodec" (NVDEC on CUDA devices)
+    # torchcodec device: "auto" (CUDA if available), "cuda" or "cpu"
+    VIDEO_DECODE_DEVICE: str = "auto"
+
+    # Inference backends (TODO FYP2: consumed once the real models are loaded)
+    INFERENCE_PRECISION: Literal["fp32", "fp16", "int8"] = "fp32"
+    INFERENCE_ENGINE: Literal["torch", "onnxrt", "tensorrt"] = "torch"
+    TRT_CALIBRATION_DIR: str = "/app/calibration"  # Sample images for TensorRT INT8 calibration
+
+    # Dashboard aggregates
+    METRICS_REFRESH_SECONDS: int = 60
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -40,10 +53,12 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-@lru_cache
+_settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached application settings."""
-    return Settings()
+    """Get application settings."""
+    return _settings
 
 
-settings = get_settings()
+settings = _settings
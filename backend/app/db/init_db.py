@@ -1,39 +1,45 @@
 """Database initialization utilities."""
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
 from app.models.user import User
 
+# Default accounts created on first startup: (username, email, password, role)
+DEFAULT_USERS = [
+    ("admin", "admin@surveillance.dev", "admin123", "admin"),
+    ("security", "security@surveillance.dev", "security123", "security_personnel"),
+]
+
 
 def init_db(db: Session) -> None:
     """Initialize database with default data."""
-    # Check if admin user exists
-    admin = db.query(User).filter(User.username == "admin").first()
+    usernames = [username for username, _, _, _ in DEFAULT_USERS]
+    existing = set(
+        db.scalars(select(User.username).where(User.username.in_(usernames))).all()
+    )
 
-    if not admin:
-        # Create default admin user
-        admin_user = User(
-            username="admin",
-            email="admin@surveillance.dev",
-            password_hash=get_password_hash("admin123"),
-            role="admin",
-            is_active=True,
-        )
-        db.add(admin_user)
-        db.commit()
-        print("Created default admin user: admin / admin123")
+    # Only hash passwords for accounts that are actually missing
+    missing = [
+        {
+            "username": username,
+            "email": email,
+            "password_hash": get_password_hash(password),
+            "role": role,
+            "is_active": True,
+        }
+        for username, email, password, role in DEFAULT_USERS
+        if username not in existing
+    ]
+    if not missing:
+        return
 
-    # Check if demo security user exists
-    demo_user = db.query(User).filter(User.username == "security").first()
+    # Single multi-row insert; ON CONFLICT covers another worker racing us
+    stmt = insert(User).values(missing).on_conflict_do_nothing(index_elements=["username"])
+    db.execute(stmt)
+    db.commit()
 
-    if not demo_user:
-        security_user = User(
-            username="security",
-            email="security@surveillance.dev",
-            password_hash=get_password_hash("security123"),
-            role="security_personnel",
-            is_active=True,
-        )
-        db.add(security_user)
-        db.commit()
-        print("Created demo security user: security / security123")
+    for user in missing:
+        logger.info(f"Created default user: {user['username']} ({user['role']})")
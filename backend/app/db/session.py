@@ -7,11 +7,14 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
 # Create database engine
+# Executemany INSERTs are batched into multi-row VALUES; UPDATE/DELETE use execute_batch
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
 )
 
 # Create session factory
@@ -0,0 +1,52 @@
+"""Materialized views for dashboard aggregates."""
+from sqlalchemy import DDL, Column, Float, Integer, MetaData, Table, event, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+
+# Kept out of Base.metadata so create_all never tries to create it as a table
+view_metadata = MetaData()
+
+METRICS_SUMMARY_SQL = """
+    SELECT
+        1 AS id,
+        (SELECT count(*) FROM videos) AS total_videos,
+        (SELECT count(*) FROM detections) AS total_detections,
+        pm.average_fps,
+        pm.average_area_reduction,
+        pm.total_processing_time
+    FROM (
+        SELECT
+            avg(avg_fps) AS average_fps,
+            avg(area_reduction_percentage) AS average_area_reduction,
+            sum(processing_time_seconds) AS total_processing_time
+        FROM performance_metrics
+    ) pm
+"""
+
+metrics_summary = Table(
+    "metrics_summary",
+    view_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("total_videos", Integer),
+    Column("total_detections", Integer),
+    Column("average_fps", Float),
+    Column("average_area_reduction", Float),
+    Column("total_processing_time", Float),
+)
+
+# REFRESH ... CONCURRENTLY requires a unique index on the view
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS metrics_summary AS {METRICS_SUMMARY_SQL};"
+        " CREATE UNIQUE INDEX IF NOT EXISTS ix_metrics_summary_id ON metrics_summary (id)"
+    ),
+)
+
+
+def refresh_metrics_summary(db: Session) -> None:
+    """Recompute the metrics summary without blocking concurrent readers."""
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY metrics_summary"))
+    db.commit()
@@ -1,10 +1,14 @@
 """FastAPI application entry point."""
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
 import os
 
 from app.api.v1.api import api_router
@@ -13,9 +17,49 @@ from app.core.logging import setup_logging, logger
 from app.db.session import SessionLocal, engine
 from app.db.base import Base
 from app.db.init_db import init_db
+from app.db.views import refresh_metrics_summary
 from app.utils.file_handler import ensure_upload_dirs
 
 
+class CachedStaticFiles(StaticFiles):
+    """Static files served with long-lived browser cache headers.
+
+    Uploaded videos are written under unique names and never modified, so
+    they are marked immutable. Crops, masks and sample frames are
+    overwritten in place (crops when a video is re-processed) and must be
+    revalidated against their ETag instead.
+    """
+
+    IMMUTABLE_PREFIXES = ("videos/",)
+
+    def file_response(self, full_path: str, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if self.get_path(scope).startswith(self.IMMUTABLE_PREFIXES):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+def _refresh_metrics() -> None:
+    db = SessionLocal()
+    try:
+        refresh_metrics_summary(db)
+    finally:
+        db.close()
+
+
+async def refresh_metrics_periodically() -> None:
+    """Keep the metrics_summary materialized view fresh for the dashboard."""
+    while True:
+        await asyncio.sleep(settings.METRICS_REFRESH_SECONDS)
+        try:
+            await run_in_threadpool(_refresh_metrics)
+        except Exception as e:
+            logger.warning(f"Metrics summary refresh failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup and shutdown."""
@@ -37,11 +81,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Ensure upload directories exist
     ensure_upload_dirs()
 
+    refresh_task = asyncio.create_task(refresh_metrics_periodically())
+
     logger.info("Application startup complete")
     yield
 
     # Shutdown
     logger.info("Shutting down Surveillance System API...")
+    refresh_task.cancel()
 
 
 # Create FastAPI application
@@ -70,7 +117,7 @@ app.include_router(api_router, prefix="/api/v1")
 # Mount static files for uploads
 uploads_path = settings.UPLOAD_DIR
 if os.path.exists(uploads_path):
-    app.mount("/uploads", StaticFiles(directory=uploads_path), name="uploads")
+    app.mount("/uploads", CachedStaticFiles(directory=uploads_path, html=False), name="uploads")
 
 
 @app.get("/")
@@ -3,19 +3,57 @@
 UR5: Reduced Monitoring Burden - Enables automated detection alerts
 based on configurable attribute conditions.
 """
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint,
+    func, text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, relationship
 
 from app.db.base import Base
+from app.models.enums import GenderEnum
+
+
+# Match every active rule against a set of detections server-side in one statement
+_BULK_MATCH_SQL = text("""
+    INSERT INTO triggered_alerts (
+        rule_id, detection_id, video_id, confidence_score, timestamp_in_video,
+        matched_attributes, is_read, is_acknowledged
+    )
+    SELECT
+        r.rule_id, d.detection_id, d.video_id, a.aggregate_confidence, d.timestamp_in_video,
+        jsonb_build_object(
+            'gender', a.gender, 'upper_color', a.upper_color, 'lower_color', a.lower_color
+        ),
+        false, false
+    FROM detections d
+    JOIN attributes a ON a.detection_id = d.detection_id
+    JOIN alert_rules r
+      ON r.is_active
+     AND (r.gender IS NULL OR r.gender = a.gender)
+     AND (r.upper_color IS NULL OR lower(r.upper_color) = lower(a.upper_color))
+     AND (r.lower_color IS NULL OR lower(r.lower_color) = lower(a.lower_color))
+     AND a.aggregate_confidence >= COALESCE(r.min_confidence, 0)
+    WHERE d.detection_id = ANY(:ids)
+    ON CONFLICT (rule_id, detection_id) DO NOTHING
+""")
 
 
 class AlertRule(Base):
     """Alert rule configuration for automated detection notifications."""
 
     __tablename__ = "alert_rules"
+    __table_args__ = (
+        Index("ix_alert_rules_active_user", "is_active", "user_id"),
+        # Partial index: matching only ever considers active rules
+        Index(
+            "ix_alert_rules_active_attrs",
+            "gender", "upper_color", "lower_color",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     rule_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -23,7 +61,7 @@ class AlertRule(Base):
     description = Column(String(500), nullable=True)
 
     # Attribute filters (any matching detection triggers alert)
-    gender = Column(String(20), nullable=True)
+    gender = Column(GenderEnum, nullable=True)
     upper_color = Column(String(50), nullable=True)
     lower_color = Column(String(50), nullable=True)
     min_confidence = Column(Float, default=0.7)
@@ -33,18 +71,47 @@ class AlertRule(Base):
     notify_on_match = Column(Boolean, default=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="alert_rules")
-    triggered_alerts = relationship("TriggeredAlert", back_populates="rule", cascade="all, delete-orphan")
+    # The FK's ON DELETE CASCADE removes alerts; the collection is never loaded for it
+    triggered_alerts = relationship(
+        "TriggeredAlert", back_populates="rule", cascade="save-update",
+        lazy="raise_on_sql", passive_deletes=True,
+    )
 
 
 class TriggeredAlert(Base):
     """Record of alerts triggered by matching detections."""
 
     __tablename__ = "triggered_alerts"
+    __table_args__ = (
+        UniqueConstraint("rule_id", "detection_id", name="uq_triggered_alert_rule_detection"),
+        # Partial indexes hold only the hot unread/unacknowledged rows
+        Index(
+            "ix_triggered_alerts_rule_unread",
+            "rule_id", "triggered_at",
+            postgresql_where=text("is_read = false"),
+        ),
+        Index(
+            "ix_triggered_alerts_rule_unack",
+            "rule_id", "triggered_at",
+            postgresql_where=text("is_acknowledged = false"),
+        ),
+        # GIN index for containment lookups (matched_attributes @> '{...}')
+        Index(
+            "ix_triggered_alerts_matched_gin",
+            "matched_attributes",
+            postgresql_using="gin",
+            postgresql_ops={"matched_attributes": "jsonb_path_ops"},
+        ),
+        # Append-only by triggered_at: BRIN gives range pruning for retention sweeps
+        Index("ix_triggered_alerts_triggered_brin", "triggered_at", postgresql_using="brin"),
+    )
+
+    __mapper_args__ = {"eager_defaults": False}
 
     alert_id = Column(Integer, primary_key=True, index=True)
     rule_id = Column(Integer, ForeignKey("alert_rules.rule_id", ondelete="CASCADE"), nullable=False)
@@ -52,7 +119,7 @@ class TriggeredAlert(Base):
     video_id = Column(Integer, ForeignKey("videos.video_id", ondelete="CASCADE"), nullable=False)
 
     # Alert details
-    matched_attributes = Column(JSON, nullable=True)  # What attributes triggered the alert
+    matched_attributes = Column(JSONB, nullable=True)  # What attributes triggered the alert
     confidence_score = Column(Float, nullable=True)
     timestamp_in_video = Column(Float, nullable=True)
 
@@ -60,12 +127,37 @@ class TriggeredAlert(Base):
     is_read = Column(Boolean, default=False)
     is_acknowledged = Column(Boolean, default=False)
     acknowledged_by = Column(Integer, ForeignKey("users.user_id"), nullable=True)
-    acknowledged_at = Column(DateTime, nullable=True)
+    acknowledged_at = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
-    triggered_at = Column(DateTime, default=datetime.utcnow)
+    triggered_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     rule = relationship("AlertRule", back_populates="triggered_alerts")
     detection = relationship("Detection", backref="alerts")
     video = relationship("Video", backref="alerts")
+
+    @classmethod
+    def bulk_match(cls, session: Session, detection_ids: list[int]) -> int:
+        """
+        Evaluate all active alert rules against the given detections.
+
+        Runs a single INSERT ... SELECT joining detections, attributes and
+        alert_rules instead of looping rules per detection in Python.
+
+        Args:
+            session: SQLAlchemy database session
+            detection_ids: Detections to evaluate
+
+        Returns:
+            Number of alerts triggered
+        """
+        if not detection_ids:
+            return 0
+        result = session.execute(_BULK_MATCH_SQL, {"ids": list(detection_ids)})
+        return result.rowcount
+
+
+# Per-day rollups group by this expression; UTC conversion keeps it immutable
+TRIGGERED_DAY = func.date_trunc("day", func.timezone("UTC", TriggeredAlert.triggered_at))
+Index("ix_triggered_day", TRIGGERED_DAY)
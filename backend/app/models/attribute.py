@@ -1,20 +1,53 @@
 """Attribute database model."""
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Index, String, func, insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.db.base import Base
+from app.models.enums import GenderEnum
 
 if TYPE_CHECKING:
     from app.models.detection import Detection
 
 
+# Mean of the available attribute confidences, 0 when none are set
+AGGREGATE_CONFIDENCE_SQL = (
+    "COALESCE("
+    "(COALESCE(upper_color_confidence, 0) + COALESCE(lower_color_confidence, 0)"
+    " + COALESCE(gender_confidence, 0))"
+    " / NULLIF((upper_color_confidence IS NOT NULL)::int"
+    " + (lower_color_confidence IS NOT NULL)::int"
+    " + (gender_confidence IS NOT NULL)::int, 0),"
+    " 0)"
+)
+
+
+def compute_search_confidence(
+    detection_confidence: float,
+    upper_color_confidence: Optional[float],
+    lower_color_confidence: Optional[float],
+    gender_confidence: Optional[float],
+) -> float:
+    """FR9 ranking score: product of detection and available attribute confidences."""
+    score = detection_confidence
+    for confidence in (upper_color_confidence, lower_color_confidence, gender_confidence):
+        if confidence is not None:
+            score *= confidence
+    return score
+
+
 class Attribute(Base):
     """Attribute model for person attribute classification results."""
 
     __tablename__ = "attributes"
+    __table_args__ = (
+        # Serves combined gender + upper color filters without a bitmap AND
+        Index("ix_attr_det_gender_upper", "detection_id", "gender", "upper_color"),
+    )
+
+    __mapper_args__ = {"eager_defaults": False}
 
     attribute_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     detection_id: Mapped[int] = mapped_column(
@@ -24,8 +57,14 @@ class Attribute(Base):
     upper_color_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lower_color: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
     lower_color_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    gender: Mapped[Optional[str]] = mapped_column(String(10), nullable=True, index=True)  # 'male', 'female', 'unknown'
+    gender: Mapped[Optional[str]] = mapped_column(GenderEnum, nullable=True, index=True)
     gender_confidence: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Stored generated column so alert matching can filter on it through an index
+    aggregate_confidence: Mapped[float] = mapped_column(
+        Float, Computed(AGGREGATE_CONFIDENCE_SQL, persisted=True), index=True
+    )
+    # FR9 search ranking score, denormalized at insert (it spans detections and attributes)
+    search_confidence: Mapped[float] = mapped_column(Float, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -33,19 +72,30 @@ class Attribute(Base):
     # Relationships
     detection: Mapped["Detection"] = relationship("Detection", back_populates="attributes")
 
-    @property
-    def aggregate_confidence(self) -> float:
-        """Calculate aggregate confidence across all attributes."""
-        confidences = [
-            c for c in [
-                self.upper_color_confidence,
-                self.lower_color_confidence,
-                self.gender_confidence
-            ] if c is not None
-        ]
-        if not confidences:
-            return 0.0
-        return sum(confidences) / len(confidences)
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: list[dict[str, Any]]) -> None:
+        """Insert attribute rows with a single multi-row INSERT, bypassing the ORM unit of work.
+
+        Args:
+            session: Database session
+            rows: Column values, one dict per attribute
+        """
+        if rows:
+            session.execute(insert(cls), rows)
 
     def __repr__(self) -> str:
         return f"<Attribute {self.attribute_id} gender={self.gender}>"
+
+
+# Functional indexes for case-insensitive attribute matching (lower(col) = :value)
+Index("ix_attr_upper_color_lower", func.lower(Attribute.upper_color))
+Index("ix_attr_lower_color_lower", func.lower(Attribute.lower_color))
+
+# Common search filter combination, ordered by the ranking score
+Index(
+    "ix_attr_search_filters",
+    Attribute.gender,
+    func.lower(Attribute.upper_color),
+    func.lower(Attribute.lower_color),
+    Attribute.search_confidence,
+)
@@ -29,7 +29,7 @@ class Camera(Base):
 
     # Relationships
     segmentation_masks: Mapped[list["SegmentationMask"]] = relationship(
-        "SegmentationMask", back_populates="camera", cascade="all, delete-orphan"
+        "SegmentationMask", back_populates="camera", cascade="save-update", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -1,9 +1,11 @@
 """Detection database model."""
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, func, insert,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.db.base import Base
 
@@ -18,14 +20,29 @@ class Detection(Base):
     __tablename__ = "detections"
     __table_args__ = (
         UniqueConstraint("video_id", "frame_number", "bbox_x", "bbox_y", name="uq_detection_location"),
+        # Covering index for per-video time-range scans (index-only, no heap visit)
+        Index(
+            "ix_det_video_ts",
+            "video_id",
+            "timestamp_in_video",
+            postgresql_include=[
+                "bbox_x", "bbox_y", "bbox_width", "bbox_height",
+                "detection_confidence", "person_crop_path",
+            ],
+        ),
+        # Rows arrive in created_at order, so a BRIN index prunes time ranges cheaply
+        Index("ix_det_created_brin", "created_at", postgresql_using="brin"),
     )
 
+    # Skip RETURNING of server defaults (created_at) on ORM inserts; they load on access
+    __mapper_args__ = {"eager_defaults": False}
+
     detection_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     video_id: Mapped[int] = mapped_column(
         ForeignKey("videos.video_id", ondelete="CASCADE"), nullable=False, index=True
     )
     frame_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    timestamp_in_video: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    timestamp_in_video: Mapped[float] = mapped_column(Float, nullable=False)
     bbox_x: Mapped[int] = mapped_column(Integer, nullable=False)
     bbox_y: Mapped[int] = mapped_column(Integer, nullable=False)
     bbox_width: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -38,9 +55,33 @@ class Detection(Base):
 
     # Relationships
     video: Mapped["Video"] = relationship("Video", back_populates="detections")
+    # Implicit loads raise; callers batch-load with selectinload(Detection.attributes)
     attributes: Mapped[list["Attribute"]] = relationship(
-        "Attribute", back_populates="detection", cascade="all, delete-orphan"
+        "Attribute", back_populates="detection", cascade="save-update",
+        lazy="raise_on_sql", passive_deletes=True,
     )
 
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: list[dict[str, Any]]) -> list[int]:
+        """Insert detection rows with a single multi-row INSERT, bypassing the ORM unit of work.
+
+        Args:
+            session: Database session
+            rows: Column values, one dict per detection
+
+        Returns:
+            Generated detection IDs in the same order as rows
+        """
+        if not rows:
+            return []
+        result = session.execute(
+            insert(cls).returning(cls.detection_id, sort_by_parameter_order=True), rows
+        )
+        return list(result.scalars())
+
     def __repr__(self) -> str:
         return f"<Detection {self.detection_id} frame={self.frame_number}>"
+
+
+# Per-video confidence ranking/threshold scans without a sort node
+Index("ix_det_conf_desc", Detection.video_id, Detection.detection_confidence.desc())
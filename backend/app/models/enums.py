@@ -0,0 +1,8 @@
+"""Native PostgreSQL enum types for low-cardinality columns."""
+from sqlalchemy import Enum
+
+GenderEnum = Enum("male", "female", "unknown", name="gender_enum")
+RoleEnum = Enum("admin", "security_personnel", name="role_enum")
+ProcessingStatusEnum = Enum(
+    "uploaded", "processing", "completed", "failed", name="processing_status_enum"
+)
@@ -18,7 +18,7 @@ class PerformanceMetric(Base):
 
     metric_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     video_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("videos.video_id"), nullable=True
+        ForeignKey("videos.video_id", ondelete="CASCADE"), nullable=True
     )
     avg_fps: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     total_detections: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional, Any, TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,7 +19,7 @@ class SearchHistory(Base):
 
     search_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("users.user_id"), nullable=True, index=True
+        ForeignKey("users.user_id"), nullable=True
     )
     query_text: Mapped[str] = mapped_column(Text, nullable=False)
     parsed_attributes: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB, nullable=True)
@@ -33,3 +33,7 @@ class SearchHistory(Base):
 
     def __repr__(self) -> str:
         return f"<SearchHistory {self.search_id}>"
+
+
+# History listing (WHERE user_id = ? ORDER BY search_timestamp DESC LIMIT n) is a pure range scan
+Index("ix_search_hist_user_ts", SearchHistory.user_id, SearchHistory.search_timestamp.desc())
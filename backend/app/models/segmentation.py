@@ -18,7 +18,7 @@ class SegmentationMask(Base):
 
     mask_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     camera_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("cameras.camera_id"), nullable=True
+        ForeignKey("cameras.camera_id", ondelete="CASCADE"), nullable=True
     )
     mask_file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     reduction_percentage: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -2,10 +2,12 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import DDL, Boolean, DateTime, String, event, func
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.models.enums import RoleEnum
 
 
 class User(Base):
@@ -14,10 +16,11 @@ class User(Base):
     __tablename__ = "users"
 
     user_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
-    email: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
+    # citext: case-insensitive equality served directly by the unique indexes
+    username: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    role: Mapped[str] = mapped_column(String(20), nullable=False)  # 'admin' or 'security_personnel'
+    role: Mapped[str] = mapped_column(RoleEnum, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -31,3 +34,7 @@ class User(Base):
 
     def __repr__(self) -> str:
         return f"<User {self.username}>"
+
+
+# citext lives in an extension that must exist before the users table is created
+event.listen(User.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS citext"))
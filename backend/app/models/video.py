@@ -6,6 +6,7 @@ from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.models.enums import ProcessingStatusEnum
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -28,20 +29,24 @@ class Video(Base):
     fps: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     resolution: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     total_frames: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    processing_status: Mapped[str] = mapped_column(
-        String(20), default="uploaded"
-    )  # 'uploaded', 'processing', 'completed', 'failed'
+    processing_status: Mapped[str] = mapped_column(ProcessingStatusEnum, default="uploaded")
     uploaded_by: Mapped[Optional[int]] = mapped_column(
         ForeignKey("users.user_id"), nullable=True
     )
 
     # Relationships
-    uploader: Mapped[Optional["User"]] = relationship("User", back_populates="videos")
+    # Lazy loads raise so list endpoints must choose joinedload/selectinload explicitly.
+    # Child rows are removed by the FKs' ON DELETE CASCADE, not by ORM cascades.
+    uploader: Mapped[Optional["User"]] = relationship(
+        "User", back_populates="videos", lazy="raise_on_sql"
+    )
     detections: Mapped[list["Detection"]] = relationship(
-        "Detection", back_populates="video", cascade="all, delete-orphan"
+        "Detection", back_populates="video", cascade="save-update", passive_deletes=True,
+        lazy="raise_on_sql",
     )
     performance_metrics: Mapped[list["PerformanceMetric"]] = relationship(
-        "PerformanceMetric", back_populates="video", cascade="all, delete-orphan"
+        "PerformanceMetric", back_populates="video", cascade="save-update", passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     def __repr__(self) -> str:
@@ -6,7 +6,7 @@ and triggered alert notifications.
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AlertRuleBase(BaseModel):
@@ -45,8 +45,7 @@ class AlertRuleResponse(AlertRuleBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TriggeredAlertResponse(BaseModel):
@@ -66,8 +65,7 @@ class TriggeredAlertResponse(BaseModel):
     acknowledged_at: Optional[datetime] = None
     triggered_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AlertStats(BaseModel):
@@ -77,3 +75,4 @@ class AlertStats(BaseModel):
     total_triggered: int
     unread_alerts: int
     unacknowledged_alerts: int
+    triggered_by_day: dict[str, int] = {}
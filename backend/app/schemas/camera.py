@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CameraBase(BaseModel):
@@ -34,8 +34,7 @@ class CameraResponse(CameraBase):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SegmentationMaskResponse(BaseModel):
@@ -47,5 +46,4 @@ class SegmentationMaskResponse(BaseModel):
     generation_timestamp: datetime
     sample_frame_path: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BoundingBox(BaseModel):
@@ -35,8 +35,7 @@ class AttributeResponse(AttributeBase):
     aggregate_confidence: float
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DetectionBase(BaseModel):
@@ -64,8 +63,7 @@ class DetectionResponse(DetectionBase):
     created_at: datetime
     attributes: list[AttributeResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DetectionWithVideo(DetectionResponse):
@@ -2,7 +2,8 @@
 from datetime import datetime
 from typing import Optional, Any
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NaturalLanguageQuery(BaseModel):
@@ -28,7 +29,7 @@ class AdvancedSearchQuery(BaseModel):
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
 
 
-class ParsedQuery(BaseModel):
+class ParsedQuery(msgspec.Struct, kw_only=True):
     """Schema for parsed query attributes."""
     gender: Optional[str] = None
     upper_color: Optional[str] = None
@@ -36,8 +37,8 @@ class ParsedQuery(BaseModel):
     raw_query: str
 
 
-class SearchResultItem(BaseModel):
-    """Schema for individual search result."""
+class SearchResultItem(msgspec.Struct, kw_only=True):
+    """Schema for individual search result (msgspec: built from trusted DB rows)."""
     detection_id: int
     video_id: int
     video_filename: str
@@ -57,8 +58,32 @@ class SearchResultItem(BaseModel):
     gender_confidence: Optional[float] = None
     aggregate_confidence: float
 
+    @classmethod
+    def from_row(cls, row: Any) -> "SearchResultItem":
+        """Build a result item from a search query row."""
+        return cls(
+            detection_id=row.detection_id,
+            video_id=row.video_id,
+            video_filename=row.video_filename,
+            frame_number=row.frame_number,
+            timestamp_in_video=row.timestamp_in_video,
+            bbox_x=row.bbox_x,
+            bbox_y=row.bbox_y,
+            bbox_width=row.bbox_width,
+            bbox_height=row.bbox_height,
+            detection_confidence=row.detection_confidence,
+            person_crop_path=row.person_crop_path,
+            upper_color=row.upper_color,
+            upper_color_confidence=row.upper_color_confidence,
+            lower_color=row.lower_color,
+            lower_color_confidence=row.lower_color_confidence,
+            gender=row.gender,
+            gender_confidence=row.gender_confidence,
+            aggregate_confidence=round(row.search_confidence, 3),
+        )
 
-class SearchResponse(BaseModel):
+
+class SearchResponse(msgspec.Struct, kw_only=True):
     """Schema for search results response."""
     query: str
     parsed_attributes: ParsedQuery
@@ -74,5 +99,4 @@ class SearchHistoryItem(BaseModel):
     result_count: Optional[int] = None
     search_timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
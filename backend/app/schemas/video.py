@@ -1,16 +1,24 @@
-"""Video schemas for API request/response validation."""
+"""Video schemas for API request/response validation.
+
+These are msgspec Structs rather than Pydantic models: video DTOs are
+built from trusted ORM rows on hot read paths, and msgspec constructs and
+encodes them without a validation pass.
+"""
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+import msgspec
 
-from pydantic import BaseModel, Field
+_PROCESSING_STATUS_RE = re.compile(r"^(uploaded|processing|completed|failed)$")
 
 
-class VideoBase(BaseModel):
+class VideoBase(msgspec.Struct, kw_only=True):
     """Base video schema with common fields."""
     filename: str
 
 
-class VideoCreate(VideoBase):
+class VideoCreate(VideoBase, kw_only=True):
     """Schema for creating a video record."""
     file_path: str
     duration_seconds: Optional[float] = None
@@ -19,18 +27,22 @@ class VideoCreate(VideoBase):
     total_frames: Optional[int] = None
 
 
-class VideoUpdate(BaseModel):
+class VideoUpdate(msgspec.Struct, kw_only=True):
     """Schema for updating video information."""
-    processing_status: Optional[str] = Field(
-        None, pattern="^(uploaded|processing|completed|failed)$"
-    )
+    processing_status: Optional[str] = None
     duration_seconds: Optional[float] = None
     fps: Optional[float] = None
     resolution: Optional[str] = None
     total_frames: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        if self.processing_status is not None and not _PROCESSING_STATUS_RE.match(
+            self.processing_status
+        ):
+            raise ValueError(f"Invalid processing_status: {self.processing_status}")
 
-class VideoResponse(VideoBase):
+
+class VideoResponse(VideoBase, kw_only=True):
     """Schema for video response."""
     video_id: int
     file_path: str
@@ -42,16 +54,33 @@ class VideoResponse(VideoBase):
     processing_status: str
     uploaded_by: Optional[int] = None
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm(cls, video: Any) -> "VideoResponse":
+        """Build a response from a Video ORM object."""
+        return cls(
+            video_id=video.video_id,
+            filename=video.filename,
+            file_path=video.file_path,
+            upload_timestamp=video.upload_timestamp,
+            duration_seconds=video.duration_seconds,
+            fps=video.fps,
+            resolution=video.resolution,
+            total_frames=video.total_frames,
+            processing_status=video.processing_status,
+            uploaded_by=video.uploaded_by,
+        )
 
 
-class VideoProcessingStatus(BaseModel):
+class VideoProcessingStatus(msgspec.Struct, kw_only=True):
     """Schema for video processing status updates."""
     video_id: int
     status: str
-    progress: float = Field(ge=0, le=100)
+    progress: float
     current_frame: Optional[int] = None
     total_frames: Optional[int] = None
     detections_count: int = 0
     message: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.progress <= 100:
+            raise ValueError(f"progress must be between 0 and 100, got {self.progress}")
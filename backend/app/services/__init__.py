@@ -1,23 +1,38 @@
-"""Services package."""
-from app.services.detector import DetectorService, get_detector
-from app.services.attribute_classifier import AttributeClassifier, get_attribute_classifier
-from app.services.segmentation import SegmentationService, get_segmentation_service
-from app.services.nlp_parser import NLPParser, get_nlp_parser, parse_query
-from app.services.search_engine import SearchEngine, get_search_engine
-from app.services.video_processor import VideoProcessor, get_video_processor
+"""Services package.
 
-__all__ = [
-    "DetectorService",
-    "get_detector",
-    "AttributeClassifier",
-    "get_attribute_classifier",
-    "SegmentationService",
-    "get_segmentation_service",
-    "NLPParser",
-    "get_nlp_parser",
-    "parse_query",
-    "SearchEngine",
-    "get_search_engine",
-    "VideoProcessor",
-    "get_video_processor",
-]
+Services are imported on first attribute access (PEP 562) so that reaching
+one service does not pull in the model stacks of all the others.
+"""
+import importlib
+from typing import Any
+
+_LAZY = {
+    "DetectorService": "app.services.detector",
+    "get_detector": "app.services.detector",
+    "AttributeClassifier": "app.services.attribute_classifier",
+    "get_attribute_classifier": "app.services.attribute_classifier",
+    "SegmentationService": "app.services.segmentation",
+    "get_segmentation_service": "app.services.segmentation",
+    "NLPParser": "app.services.nlp_parser",
+    "get_nlp_parser": "app.services.nlp_parser",
+    "parse_query": "app.services.nlp_parser",
+    "SearchEngine": "app.services.search_engine",
+    "get_search_engine": "app.services.search_engine",
+    "VideoProcessor": "app.services.video_processor",
+    "get_video_processor": "app.services.video_processor",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -4,12 +4,16 @@ Attribute classification service (STUB implementation).
 This module provides a stub implementation for pedestrian attribute recognition.
 TODO FYP2: Replace with fine-tuned ResNet-50 inference pipeline.
 """
-import random
-from typing import Any
+from functools import cache
+from typing import Any, Optional
 
+import cv2
 import numpy as np
 from loguru import logger
 
+from app.core.config import settings
+from app.services.inference import INPUT_DTYPES, Engine, Precision
+
 
 class AttributeClassifier:
     """Pedestrian attribute classifier using ResNet-50 (STUB)."""
@@ -17,15 +21,63 @@ class AttributeClassifier:
     # Available attribute values
     COLORS = ["red", "blue", "black", "white", "gray", "green", "yellow", "brown", "pink", "orange"]
     GENDERS = ["male", "female", "unknown"]
+    GENDER_WEIGHTS = [0.45, 0.45, 0.10]  # Slight bias away from unknown
+
+    # Model input resolution (width, height)
+    INPUT_SIZE = (224, 224)
 
-    def __init__(self) -> None:
+    # 64 x 224x224x3 uint8 is ~9.6 MB of input tensor per batch
+    MAX_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        precision: Precision = "fp32",
+        engine: Engine = "torch",
+        model: Optional[Any] = None,
+    ) -> None:
         """
         STUB: Initialize with pretrained ResNet-50 model reference.
         TODO FYP2: Load fine-tuned ResNet-50 weights for PAR task.
+
+        Args:
+            precision: Numeric precision the model runs at
+            engine: Inference runtime serving the model
+            model: Preloaded engine (e.g. a deserialized TensorRT INT8 engine)
         """
         self.model_name = "resnet50_par.pth"
+        self.precision = precision
+        self.engine = engine
+        self.model = model
+        self.input_dtype = INPUT_DTYPES[precision]
+        self._rng = np.random.default_rng()
         self._initialized = True
-        logger.info(f"STUB: Attribute classifier initialized with {self.model_name}")
+        logger.info(
+            f"STUB: Attribute classifier initialized with {self.model_name} "
+            f"({engine}, {precision})"
+        )
+
+    def _sample_attributes(self, count: int) -> list[dict[str, Any]]:
+        """Draw mock predictions for count crops with one RNG call per attribute."""
+        upper_idx = self._rng.integers(0, len(self.COLORS), size=count)
+        lower_idx = self._rng.integers(0, len(self.COLORS), size=count)
+        gender_idx = self._rng.choice(len(self.GENDERS), size=count, p=self.GENDER_WEIGHTS)
+        color_confs = np.round(self._rng.uniform(0.65, 0.92, size=(count, 2)), 3)
+        gender_confs = np.round(self._rng.uniform(0.70, 0.95, size=count), 3)
+
+        return [
+            {
+                "upper_color": self.COLORS[upper],
+                "upper_color_confidence": upper_conf,
+                "lower_color": self.COLORS[lower],
+                "lower_color_confidence": lower_conf,
+                "gender": self.GENDERS[gender],
+                "gender_confidence": gender_conf,
+            }
+            for upper, lower, gender, (upper_conf, lower_conf), gender_conf in zip(
+                upper_idx.tolist(), lower_idx.tolist(), gender_idx.tolist(),
+                color_confs.tolist(), gender_confs.tolist(),
+            )
+        ]
 
     def classify_attributes(self, person_crop: np.ndarray) -> dict[str, Any]:
         """
@@ -38,46 +90,70 @@ class AttributeClassifier:
         Returns:
             Dictionary with attribute predictions and confidences
         """
-        # Generate realistic mock predictions
-        upper_color = random.choice(self.COLORS)
-        lower_color = random.choice(self.COLORS)
-        gender = random.choices(
-            self.GENDERS,
-            weights=[0.45, 0.45, 0.10]  # Slight bias away from unknown
-        )[0]
-
-        result = {
-            "upper_color": upper_color,
-            "upper_color_confidence": round(random.uniform(0.65, 0.92), 3),
-            "lower_color": lower_color,
-            "lower_color_confidence": round(random.uniform(0.65, 0.92), 3),
-            "gender": gender,
-            "gender_confidence": round(random.uniform(0.70, 0.95), 3),
-        }
-
-        logger.debug(f"STUB: Classified attributes - gender={gender}, upper={upper_color}, lower={lower_color}")
-        return result
-
-    def classify_batch(self, crops: list[np.ndarray]) -> list[dict[str, Any]]:
+        return self.classify_batch([person_crop])[0]
+
+    def preprocess_batch(self, crops: list[np.ndarray]) -> np.ndarray:
         """
-        STUB: Batch attribute classification.
+        Resize and stack person crops into the model's (B, H, W, C) input tensor.
 
         Args:
             crops: List of cropped person images
 
         Returns:
-            List of attribute dictionaries
+            Array of shape (len(crops), INPUT_SIZE[1], INPUT_SIZE[0], 3) in the
+            engine's input dtype, so no cast happens inside the inference call
         """
-        return [self.classify_attributes(crop) for crop in crops]
-
+        width, height = self.INPUT_SIZE
+        batch = np.empty((len(crops), height, width, 3), dtype=self.input_dtype)
+        for i, crop in enumerate(crops):
+            batch[i] = cv2.resize(crop, self.INPUT_SIZE)
+        return batch
+
+    def classify_batch(
+        self, crops: list[np.ndarray], batch_size: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        STUB: Batch attribute classification.
 
-# Global singleton instance
-_classifier_instance: AttributeClassifier | None = None
+        Crops are processed in chunks of at most MAX_BATCH_SIZE; each chunk is
+        one forward pass.
 
+        Args:
+            crops: List of cropped person images
+            batch_size: Crops per forward pass (capped at MAX_BATCH_SIZE)
 
-def get_attribute_classifier() -> AttributeClassifier:
-    """Get or create the attribute classifier singleton."""
-    global _classifier_instance
-    if _classifier_instance is None:
-        _classifier_instance = AttributeClassifier()
-    return _classifier_instance
+        Returns:
+            List of attribute dictionaries, in the same order as crops
+        """
+        batch_size = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(crops), batch_size):
+            chunk = crops[start:start + batch_size]
+            # TODO FYP2: logits = self.model(self.preprocess_batch(chunk))
+            results.extend(self._sample_attributes(len(chunk)))
+
+        logger.debug(f"STUB: Classified attributes for {len(crops)} crops")
+        return results
+
+
+@cache
+def _load_attribute_classifier(precision: Precision, engine: Engine) -> AttributeClassifier:
+    """Create the classifier for one precision/engine pair, once per process."""
+    return AttributeClassifier(precision, engine)
+
+
+def get_attribute_classifier(
+    precision: Optional[Precision] = None, engine: Optional[Engine] = None
+) -> AttributeClassifier:
+    """
+    Get the attribute classifier for a precision/engine pair.
+
+    precision and engine default to the INFERENCE_* settings. Instances are
+    cached per process, so each uvicorn worker loads the weights once and
+    every request in that worker shares them.
+    """
+    return _load_attribute_classifier(
+        precision or settings.INFERENCE_PRECISION,
+        engine or settings.INFERENCE_ENGINE,
+    )
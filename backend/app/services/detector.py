@@ -4,69 +4,256 @@ Person detection service (STUB implementation).
 This module provides a stub implementation for person detection using YOLOv11.
 TODO FYP2: Replace with actual YOLOv11 inference pipeline.
 """
-import random
-from typing import Any
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Optional
 
+import cv2
 import numpy as np
 from loguru import logger
 
+from app.core.config import settings
+from app.services.inference import INPUT_DTYPES, Engine, Precision
+from app.utils.image_utils import clip_boxes
+
+
+@dataclass(slots=True)
+class DetectionBatch:
+    """Detections in struct-of-arrays form: one row per detected person."""
+    bbox: np.ndarray  # (N, 4) int32, x/y/width/height in frame pixels
+    confidence: np.ndarray  # (N,) float32
+    frame_numbers: np.ndarray  # (N,) int32
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    def rescale(self, factor: float) -> "DetectionBatch":
+        """
+        Map boxes detected on a resized frame back to original frame pixels.
+
+        Args:
+            factor: Original size divided by the detector input size
+
+        Returns:
+            New batch with scaled boxes
+        """
+        bbox = np.rint(self.bbox * factor).astype(np.int32)
+        return DetectionBatch(bbox, self.confidence, self.frame_numbers)
+
+    def clip(self, width: int, height: int) -> "DetectionBatch":
+        """
+        Clamp boxes to the frame bounds and drop those left empty.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+
+        Returns:
+            New batch containing only boxes with positive area
+        """
+        bbox, keep = clip_boxes(self.bbox, width, height)
+        return DetectionBatch(bbox[keep], self.confidence[keep], self.frame_numbers[keep])
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert to the list-of-dicts form used by the REST layer."""
+        return [
+            {"bbox": box, "confidence": round(conf, 3)}
+            for box, conf in zip(self.bbox.tolist(), self.confidence.tolist())
+        ]
+
+    def to_records(
+        self, video_id: int, fps: float, crop_paths: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Convert to Detection column mappings for a bulk INSERT.
+
+        Args:
+            video_id: Video the detections belong to
+            fps: Video frame rate, used to derive timestamps
+            crop_paths: Saved crop path for each detection, in row order
+
+        Returns:
+            One column-value dict per detection
+        """
+        return [
+            {
+                "video_id": video_id,
+                "frame_number": frame_number,
+                "timestamp_in_video": frame_number / fps,
+                "bbox_x": x,
+                "bbox_y": y,
+                "bbox_width": w,
+                "bbox_height": h,
+                "detection_confidence": round(conf, 3),
+                "person_crop_path": crop_path,
+            }
+            for (x, y, w, h), conf, frame_number, crop_path in zip(
+                self.bbox.tolist(), self.confidence.tolist(),
+                self.frame_numbers.tolist(), crop_paths,
+            )
+        ]
+
 
 class DetectorService:
     """Person detection service using YOLOv11 (STUB)."""
 
-    def __init__(self) -> None:
+    # Upper bound on mock detections per frame
+    MAX_DETECTIONS = 5
+
+    # Model input resolution (width, height)
+    INPUT_SIZE = (640, 640)
+
+    # 16 x 640x640x3 uint8 is ~20 MB of input tensor per batch
+    MAX_BATCH_SIZE = 16
+
+    def __init__(
+        self,
+        precision: Precision = "fp32",
+        engine: Engine = "torch",
+        model: Optional[Any] = None,
+    ) -> None:
         """
         STUB: Initialize with pretrained YOLOv11 model reference.
         TODO FYP2: Load actual YOLOv11s weights and configure GPU inference.
+
+        Args:
+            precision: Numeric precision the model runs at
+            engine: Inference runtime serving the model
+            model: Preloaded engine (e.g. a deserialized TensorRT INT8 engine)
         """
         self.model_name = "yolov11s.pt"
+        self.precision = precision
+        self.engine = engine
+        self.model = model
+        self.input_dtype = INPUT_DTYPES[precision]
         self.confidence_threshold = 0.6
+        self._rng = np.random.default_rng()
         self._initialized = True
-        logger.info(f"STUB: Detector initialized with model {self.model_name}")
+        logger.info(
+            f"STUB: Detector initialized with model {self.model_name} "
+            f"({engine}, {precision})"
+        )
+
+    def _sample_boxes(
+        self, height: Any, width: Any, shape: int | tuple[int, ...]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Draw all mock boxes and confidences for a frame (or batch) in one go.
 
-    def detect_persons(self, frame: np.ndarray) -> list[dict[str, Any]]:
+        height/width may be scalars or (B, 1) arrays broadcasting against shape.
+        """
+        # Generate reasonable bounding box dimensions
+        max_w = np.maximum(60, np.minimum(150, width // 3))
+        max_h = np.maximum(120, np.minimum(250, height // 2))
+        ws = self._rng.integers(60, max_w + 1, size=shape)
+        hs = self._rng.integers(120, max_h + 1, size=shape)
+        xs = self._rng.integers(0, np.maximum(1, width - ws) + 1)
+        ys = self._rng.integers(0, np.maximum(1, height - hs) + 1)
+        confs = self._rng.uniform(0.65, 0.95, size=shape)
+        return xs, ys, ws, hs, confs
+
+    def _to_batch(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        ws: np.ndarray,
+        hs: np.ndarray,
+        confs: np.ndarray,
+        frame_number: int,
+    ) -> DetectionBatch:
+        """Apply the confidence threshold and pack the arrays into a DetectionBatch."""
+        keep = confs >= self.confidence_threshold
+        return DetectionBatch(
+            bbox=np.stack([xs[keep], ys[keep], ws[keep], hs[keep]], axis=1).astype(np.int32),
+            confidence=confs[keep].astype(np.float32),
+            frame_numbers=np.full(int(keep.sum()), frame_number, dtype=np.int32),
+        )
+
+    def detect_persons(self, frame: np.ndarray, frame_number: int = 0) -> DetectionBatch:
         """
         STUB: Mock person detection.
         Returns random bounding boxes for demonstration.
 
         Args:
             frame: Input video frame as numpy array (H, W, C)
+            frame_number: Frame index recorded on each detection
 
         Returns:
-            List of detection dictionaries with bbox and confidence
+            DetectionBatch of boxes and confidences
         """
         height, width = frame.shape[:2]
-        num_detections = random.randint(0, 5)
-
-        detections = []
-        for _ in range(num_detections):
-            # Generate reasonable bounding box dimensions
-            w = random.randint(60, min(150, width // 3))
-            h = random.randint(120, min(250, height // 2))
-            x = random.randint(0, max(1, width - w))
-            y = random.randint(0, max(1, height - h))
-            conf = random.uniform(0.65, 0.95)
-
-            if conf >= self.confidence_threshold:
-                detections.append({
-                    "bbox": [x, y, w, h],
-                    "confidence": round(conf, 3),
-                })
+        num_detections = int(self._rng.integers(0, self.MAX_DETECTIONS + 1))
+
+        detections = self._to_batch(
+            *self._sample_boxes(height, width, num_detections), frame_number
+        )
 
         logger.debug(f"STUB: Detected {len(detections)} persons in frame")
         return detections
 
-    def detect_batch(self, frames: list[np.ndarray]) -> list[list[dict[str, Any]]]:
+    def preprocess_batch(self, frames: list[np.ndarray]) -> np.ndarray:
+        """
+        Resize and stack frames into the model's (B, H, W, C) input tensor.
+
+        Args:
+            frames: List of video frames
+
+        Returns:
+            Array of shape (len(frames), INPUT_SIZE[1], INPUT_SIZE[0], 3) in the
+            engine's input dtype, so no cast happens inside the inference call
+        """
+        width, height = self.INPUT_SIZE
+        batch = np.empty((len(frames), height, width, 3), dtype=self.input_dtype)
+        for i, frame in enumerate(frames):
+            batch[i] = cv2.resize(frame, self.INPUT_SIZE)
+        return batch
+
+    def detect_batch(
+        self,
+        frames: list[np.ndarray],
+        batch_size: Optional[int] = None,
+        frame_numbers: Optional[list[int]] = None,
+    ) -> list[DetectionBatch]:
         """
         STUB: Batch person detection.
 
+        Frames are processed in chunks of at most MAX_BATCH_SIZE; each chunk is
+        one forward pass. Frames may differ in size: boxes are drawn in frame
+        coordinates from a single (chunk, MAX_DETECTIONS) sample.
+
         Args:
             frames: List of video frames
+            batch_size: Frames per forward pass (capped at MAX_BATCH_SIZE)
+            frame_numbers: Frame index of each frame (defaults to list position)
 
         Returns:
-            List of detection results for each frame
+            DetectionBatch for each frame
         """
-        return [self.detect_persons(frame) for frame in frames]
+        batch_size = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        if frame_numbers is None:
+            frame_numbers = list(range(len(frames)))
+
+        results: list[DetectionBatch] = []
+        for start in range(0, len(frames), batch_size):
+            chunk = frames[start:start + batch_size]
+            # TODO FYP2: outputs = self.model(self.preprocess_batch(chunk)), rescaled per frame
+            sizes = np.array([frame.shape[:2] for frame in chunk])
+            heights, widths = sizes[:, :1], sizes[:, 1:]
+
+            xs, ys, ws, hs, confs = self._sample_boxes(
+                heights, widths, (len(chunk), self.MAX_DETECTIONS)
+            )
+            counts = self._rng.integers(0, self.MAX_DETECTIONS + 1, size=len(chunk))
+
+            results.extend(
+                self._to_batch(
+                    xs[i, :n], ys[i, :n], ws[i, :n], hs[i, :n], confs[i, :n],
+                    frame_numbers[start + i],
+                )
+                for i, n in enumerate(counts.tolist())
+            )
+
+        logger.debug(f"STUB: Detected persons in {len(frames)} frames")
+        return results
 
     def set_confidence_threshold(self, threshold: float) -> None:
         """Set the detection confidence threshold."""
@@ -74,13 +261,23 @@ class DetectorService:
         logger.info(f"Detection confidence threshold set to {self.confidence_threshold}")
 
 
-# Global singleton instance
-_detector_instance: DetectorService | None = None
+@cache
+def _load_detector(precision: Precision, engine: Engine) -> DetectorService:
+    """Create the detector for one precision/engine pair, once per process."""
+    return DetectorService(precision, engine)
+
 
+def get_detector(
+    precision: Optional[Precision] = None, engine: Optional[Engine] = None
+) -> DetectorService:
+    """
+    Get the detector service for a precision/engine pair.
 
-def get_detector() -> DetectorService:
-    """Get or create the detector service singleton."""
-    global _detector_instance
-    if _detector_instance is None:
-        _detector_instance = DetectorService()
-    return _detector_instance
+    precision and engine default to the INFERENCE_* settings. Instances are
+    cached per process, so each uvicorn worker loads the weights once and
+    every request in that worker shares them.
+    """
+    return _load_detector(
+        precision or settings.INFERENCE_PRECISION,
+        engine or settings.INFERENCE_ENGINE,
+    )
@@ -0,0 +1,15 @@
+"""Inference backend options shared by the model services."""
+from typing import Literal
+
+import numpy as np
+
+Precision = Literal["fp32", "fp16", "int8"]
+Engine = Literal["torch", "onnxrt", "tensorrt"]
+
+# Host dtype of the batched input tensor for each precision. INT8 engines
+# quantize internally from calibrated ranges, so their inputs stay float32.
+INPUT_DTYPES: dict[str, type[np.floating]] = {
+    "fp32": np.float32,
+    "fp16": np.float16,
+    "int8": np.float32,
+}
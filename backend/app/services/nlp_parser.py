@@ -4,10 +4,25 @@ Natural language query parser for attribute-based search.
 This module provides simple keyword-based NLP parsing for search queries.
 """
 import re
+import sys
+from functools import lru_cache
 from typing import Optional
 
 from loguru import logger
 
+# Bump when the vocabulary or extraction rules change, so callers caching
+# parse results outside this process can invalidate them
+PARSER_VERSION = 2
+
+# Distinct normalized queries kept per parser
+PARSE_CACHE_SIZE = 4096
+
+# Where a garment keyword sits in its token: the whole token, the token minus
+# a plural "s", or the end of a compound such as "t-shirt"
+_HEAD = "head"
+_PLURAL = "plural"
+_TAIL = "tail"
+
 
 class NLPParser:
     """Natural language query parser for person attribute search."""
@@ -45,6 +60,47 @@ class NLPParser:
         "lower", "legs", "slacks", "leggings", "joggers"
     ]
 
+    # Gender vocabulary
+    MALE_KEYWORDS = ["man", "male", "boy", "guy", "gentleman"]
+    FEMALE_KEYWORDS = ["woman", "female", "girl", "lady"]
+
+    # Garment words ending in another keyword; they read the word after them ("t-shirt in red")
+    _COMPOUND_GARMENTS = ("t-shirt", "tshirt")
+
+    # Keywords whose preceding word the "wearing" fallback also reads
+    _WEARING_GARMENTS = frozenset({"shirt", "top"})
+
+    # Compiled once at import; the only regex left on the parse path
+    _TOKEN_RE = re.compile(r"[\w-]+")
+
+    def __init__(self) -> None:
+        # Single keyword table so a query is scanned once instead of once per keyword.
+        # A token maps to (category, value, kind) hits; kind records where the
+        # keyword sits in the token, which decides whether a color may precede
+        # it (_HEAD, _PLURAL) or follow it (_HEAD, _TAIL).
+        self._vocabulary: dict[str, list[tuple[str, str, str]]] = {}
+
+        def add(token: str, category: str, value: str, kind: str = _HEAD) -> None:
+            self._vocabulary.setdefault(sys.intern(token), []).append((category, value, kind))
+
+        for word in self.MALE_KEYWORDS:
+            add(word, "gender", "male")
+        for word in self.FEMALE_KEYWORDS:
+            add(word, "gender", "female")
+        for category, keywords in (("upper", self.UPPER_KEYWORDS), ("lower", self.LOWER_KEYWORDS)):
+            for word in keywords:
+                add(word, category, word)
+                # "red shirts", "black skirts": plural garments take the color before them
+                add(f"{word}s", category, word, _PLURAL)
+        for compound in self._COMPOUND_GARMENTS:
+            for word in self.UPPER_KEYWORDS:
+                if compound != word and compound.endswith(word):
+                    add(compound, "upper", word, _TAIL)
+        add("wearing", "wearing", "wearing")
+
+        # Per instance, so the cache never holds the parser as part of its key
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_normalized)
+
     def parse_query(self, query_text: str) -> dict[str, Optional[str]]:
         """
         Extract attributes from natural language query.
@@ -61,68 +117,144 @@ class NLPParser:
         Returns:
             Dictionary with extracted attributes
         """
-        query_lower = query_text.lower().strip()
         logger.debug(f"Parsing query: {query_text}")
 
+        gender, upper_color, lower_color = self._parse_cached(query_text.lower().strip())
         result = {
-            "gender": self._extract_gender(query_lower),
-            "upper_color": self._extract_upper_color(query_lower),
-            "lower_color": self._extract_lower_color(query_lower),
+            "gender": gender,
+            "upper_color": upper_color,
+            "lower_color": lower_color,
         }
 
         logger.info(f"Parsed query '{query_text}' -> {result}")
         return result
 
-    def _extract_gender(self, query: str) -> Optional[str]:
-        """Extract gender from query."""
-        # Check for explicit gender mentions
-        if re.search(r'\b(man|male|boy|guy|gentleman)\b', query):
-            if not re.search(r'\b(woman|female|girl|lady)\b', query):
-                return "male"
+    def _parse_normalized(
+        self, query_lower: str
+    ) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """Parse a lowercased query into (gender, upper_color, lower_color)."""
+        # Interned tokens hit the vocabulary dicts on identity before comparing text
+        tokens = [sys.intern(token) for token in self._TOKEN_RE.findall(query_lower)]
+        matches = self._scan(tokens)
+        return (
+            self._extract_gender(matches),
+            self._extract_upper_color(tokens, matches),
+            self._extract_lower_color(tokens, matches),
+        )
 
-        if re.search(r'\b(woman|female|girl|lady)\b', query):
-            return "female"
+    def _scan(self, tokens: list[str]) -> dict[str, dict[str, list[tuple[int, str]]]]:
+        """Map each category to {value: [(token index, kind), ...]} in one pass."""
+        matches: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        for index, token in enumerate(tokens):
+            for category, value, kind in self._vocabulary.get(token, ()):
+                matches.setdefault(category, {}).setdefault(value, []).append((index, kind))
+        return matches
+
+    @staticmethod
+    def _word_before(tokens: list[str], index: int) -> Optional[str]:
+        """Return the word preceding a token, if any."""
+        if index <= 0:
+            return None
+        # "navy-blue shirt" reads as "blue shirt"
+        return tokens[index - 1].rpartition("-")[2]
+
+    @staticmethod
+    def _word_after(tokens: list[str], index: int, filler: str) -> Optional[str]:
+        """Return the word following a token, skipping one filler word ("shirt in red")."""
+        index += 1
+        if index + 1 < len(tokens) and tokens[index] == filler:
+            index += 1
+        if index >= len(tokens):
+            return None
+        return tokens[index].partition("-")[0]
+
+    def _keyword_word(
+        self, tokens: list[str], occurrences: list[tuple[int, str]], after: bool
+    ) -> Optional[str]:
+        """
+        Return the word next to the first keyword occurrence that has one.
+
+        The word before the keyword wins; when after is set, a keyword that
+        starts the query or ends a compound ("t-shirt in red") reads the word
+        after it instead.
+        """
+        for index, kind in occurrences:
+            if kind != _TAIL and index > 0:
+                return self._word_before(tokens, index)
+            if after and kind != _PLURAL:
+                word = self._word_after(tokens, index, "in")
+                if word is not None:
+                    return word
+        return None
 
+    def _extract_gender(
+        self, matches: dict[str, dict[str, list[tuple[int, str]]]]
+    ) -> Optional[str]:
+        """Extract gender from query."""
+        genders = matches.get("gender", {})
+        if "female" in genders:
+            return "female"
+        if "male" in genders:
+            return "male"
         return None
 
-    def _extract_upper_color(self, query: str) -> Optional[str]:
+    def _extract_upper_color(
+        self, tokens: list[str], matches: dict[str, dict[str, list[tuple[int, str]]]]
+    ) -> Optional[str]:
         """Extract upper body clothing color."""
         # First, try to find color near upper body keywords
+        upper = matches.get("upper", {})
         for keyword in self.UPPER_KEYWORDS:
-            if keyword in query:
+            if keyword in upper:
                 # Look for color before or after the keyword
-                pattern = rf'(\w+)\s+{keyword}|{keyword}\s+(?:in\s+)?(\w+)'
-                match = re.search(pattern, query)
-                if match:
-                    potential_color = match.group(1) or match.group(2)
-                    if potential_color in self.COLOR_MAP:
-                        return self.COLOR_MAP[potential_color]
-
-        # Try pattern: "wearing [color]" or "[color] wearing"
-        wearing_pattern = r'wearing\s+(?:a\s+)?(\w+)|(\w+)\s+(?:shirt|top)'
-        match = re.search(wearing_pattern, query)
-        if match:
-            color = match.group(1) or match.group(2)
-            if color in self.COLOR_MAP:
-                return self.COLOR_MAP[color]
+                word = self._keyword_word(tokens, upper[keyword], after=True)
+                color = _INTERNED_COLORS.get(word) if word else None
+                if color:
+                    return color
 
-        return None
+        # Try pattern: "wearing [color]" or "[color] shirt/top", whichever comes first
+        wearing = next(
+            (
+                index for index, _ in matches.get("wearing", {}).get("wearing", ())
+                if index + 1 < len(tokens)
+            ),
+            None,
+        )
+        garment = min(
+            (
+                index - 1
+                for keyword in self._WEARING_GARMENTS
+                for index, kind in upper.get(keyword, ())
+                if kind != _TAIL and index > 0
+            ),
+            default=None,
+        )
+        if wearing is not None and (garment is None or wearing <= garment):
+            word = self._word_after(tokens, wearing, "a")
+        elif garment is not None:
+            word = self._word_before(tokens, garment + 1)
+        else:
+            return None
+        return _INTERNED_COLORS.get(word) if word else None
 
-    def _extract_lower_color(self, query: str) -> Optional[str]:
+    def _extract_lower_color(
+        self, tokens: list[str], matches: dict[str, dict[str, list[tuple[int, str]]]]
+    ) -> Optional[str]:
         """Extract lower body clothing color."""
-        # Look for color near lower body keywords
+        # Look for color before lower body keywords
+        lower = matches.get("lower", {})
         for keyword in self.LOWER_KEYWORDS:
-            if keyword in query:
-                # Look for color before the keyword
-                pattern = rf'(\w+)\s+{keyword}'
-                match = re.search(pattern, query)
-                if match:
-                    potential_color = match.group(1)
-                    if potential_color in self.COLOR_MAP:
-                        return self.COLOR_MAP[potential_color]
+            if keyword in lower:
+                word = self._keyword_word(tokens, lower[keyword], after=False)
+                color = _INTERNED_COLORS.get(word) if word else None
+                if color:
+                    return color
 
         return None
 
+# Color vocabulary with interned keys and canonical values
+_INTERNED_COLORS = {sys.intern(k): sys.intern(v) for k, v in NLPParser.COLOR_MAP.items()}
+
 
 # Global singleton instance
 _parser_instance: NLPParser | None = None
@@ -3,9 +3,10 @@ Search engine for attribute-based person detection queries.
 
 This module provides database search functionality based on parsed attributes.
 """
-from typing import Optional
+from itertools import chain
+from typing import Any, Iterator, Optional
 
-from sqlalchemy import and_, asc, desc, func
+from sqlalchemy import Select, and_, asc, bindparam, desc, func, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.models import Attribute, Detection, Video
@@ -16,6 +17,14 @@ from loguru import logger
 class SearchEngine:
     """Search engine for querying detections by attributes."""
 
+    # Rows fetched per round trip when streaming results
+    STREAM_BATCH_SIZE = 200
+
+    # Search statements keyed by filter shape and sort. Only which filters are
+    # set changes the SQL; values are bound at execution, so each shape is built
+    # once per process and reuses the engine's compiled-SQL cache entry.
+    _statements: dict[tuple[bool, bool, bool, bool, bool, bool, str, str], Select] = {}
+
     def __init__(self, db: Session) -> None:
         """
         Initialize search engine with database session.
@@ -58,14 +67,148 @@ class SearchEngine:
         Returns:
             Tuple of (list of SearchResultItem, total count)
         """
+        statement, params = self._prepare(
+            gender=gender,
+            upper_color=upper_color,
+            lower_color=lower_color,
+            min_confidence=min_confidence,
+            video_id=video_id,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+
+        # Execute query
+        results = self.db.execute(statement, params).all()
+        total_count = self._total_count(statement, params, results[0] if results else None)
+
+        # Transform to response schema
+        items = [SearchResultItem.from_row(row) for row in results]
+
+        logger.info(f"Search returned {len(items)} results (total: {total_count})")
+        return items, total_count
+
+    def iter_search(self, **filters: Any) -> tuple[Iterator[SearchResultItem], int]:
+        """
+        Execute a search, streaming result rows from the database.
+
+        The first row is fetched up front to read the total count; the rest are
+        pulled STREAM_BATCH_SIZE at a time as the iterator is consumed, so the
+        session must stay open until it is exhausted.
+
+        Args:
+            **filters: Same keyword arguments as search()
+
+        Returns:
+            Tuple of (iterator of SearchResultItem, total count)
+        """
+        statement, params = self._prepare(**filters)
+        rows = iter(self.db.execute(
+            statement, params, execution_options={"yield_per": self.STREAM_BATCH_SIZE}
+        ))
+        first = next(rows, None)
+        total_count = self._total_count(statement, params, first)
+
+        if first is None:
+            return iter(()), total_count
+        return (SearchResultItem.from_row(row) for row in chain((first,), rows)), total_count
+
+    def _total_count(self, statement: Select, params: dict[str, Any], first_row: Any) -> int:
+        """Read the window count off the first row; count separately only past the last page."""
+        if first_row is not None:
+            return first_row.total_count
+        if params["offset"] > 0:
+            # Paged past the end: the window count has no row to ride on
+            unpaged = statement.limit(None).offset(None).order_by(None).subquery()
+            return self.db.execute(select(func.count()).select_from(unpaged), params).scalar_one()
+        return 0
+
+    def _prepare(
+        self,
+        gender: Optional[str] = None,
+        upper_color: Optional[str] = None,
+        lower_color: Optional[str] = None,
+        min_confidence: float = 0.6,
+        video_id: Optional[int] = None,
+        start_timestamp: Optional[float] = None,
+        end_timestamp: Optional[float] = None,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "confidence",
+        sort_order: str = "desc",
+    ) -> tuple[Select, dict[str, Any]]:
+        """Pick the cached statement for this filter shape and bind the values (see search())."""
         logger.debug(
             f"Searching: gender={gender}, upper={upper_color}, "
             f"lower={lower_color}, min_conf={min_confidence}"
         )
 
-        # Build base query
-        query = (
-            self.db.query(Detection, Attribute, Video)
+        key = (
+            bool(gender),
+            bool(upper_color),
+            bool(lower_color),
+            bool(video_id),
+            start_timestamp is not None,
+            end_timestamp is not None,
+            sort_by,
+            sort_order,
+        )
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = self._build_statement(*key)
+
+        params = {
+            "gender": gender.lower() if gender else None,
+            "upper_color": upper_color.lower() if upper_color else None,
+            "lower_color": lower_color.lower() if lower_color else None,
+            "video_id": video_id,
+            "start_timestamp": start_timestamp,
+            "end_timestamp": end_timestamp,
+            "min_confidence": min_confidence,
+            "limit": limit,
+            "offset": offset,
+        }
+        return statement, params
+
+    @staticmethod
+    def _build_statement(
+        has_gender: bool,
+        has_upper_color: bool,
+        has_lower_color: bool,
+        has_video_id: bool,
+        has_start_timestamp: bool,
+        has_end_timestamp: bool,
+        sort_by: str,
+        sort_order: str,
+    ) -> Select:
+        """Build the search statement for one filter shape, with every value as a bind parameter."""
+        # Select plain columns (no ORM object hydration); the total rides along
+        # as a window count so pagination and counting share one statement
+        statement = (
+            select(
+                Detection.detection_id,
+                Detection.video_id,
+                Video.filename.label("video_filename"),
+                Detection.frame_number,
+                Detection.timestamp_in_video,
+                Detection.bbox_x,
+                Detection.bbox_y,
+                Detection.bbox_width,
+                Detection.bbox_height,
+                Detection.detection_confidence,
+                Detection.person_crop_path,
+                Attribute.upper_color,
+                Attribute.upper_color_confidence,
+                Attribute.lower_color,
+                Attribute.lower_color_confidence,
+                Attribute.gender,
+                Attribute.gender_confidence,
+                Attribute.search_confidence,
+                func.count().over().label("total_count"),
+            )
             .join(Attribute, Detection.detection_id == Attribute.detection_id)
             .join(Video, Detection.video_id == Video.video_id)
         )
@@ -73,98 +216,48 @@ class SearchEngine:
         # Apply filters
         filters = []
 
-        if gender:
-            filters.append(Attribute.gender == gender)
+        # Case-insensitive matches served by the lower(col) functional indexes;
+        # gender is a native enum of lowercase values
+        if has_gender:
+            filters.append(Attribute.gender == bindparam("gender"))
 
-        if upper_color:
-            filters.append(Attribute.upper_color == upper_color)
+        if has_upper_color:
+            filters.append(func.lower(Attribute.upper_color) == bindparam("upper_color"))
 
-        if lower_color:
-            filters.append(Attribute.lower_color == lower_color)
+        if has_lower_color:
+            filters.append(func.lower(Attribute.lower_color) == bindparam("lower_color"))
 
-        if video_id:
-            filters.append(Detection.video_id == video_id)
+        if has_video_id:
+            filters.append(Detection.video_id == bindparam("video_id"))
 
-        if start_timestamp is not None:
-            filters.append(Detection.timestamp_in_video >= start_timestamp)
+        if has_start_timestamp:
+            filters.append(Detection.timestamp_in_video >= bindparam("start_timestamp"))
 
-        if end_timestamp is not None:
-            filters.append(Detection.timestamp_in_video <= end_timestamp)
+        if has_end_timestamp:
+            filters.append(Detection.timestamp_in_video <= bindparam("end_timestamp"))
 
-        # Apply confidence filter (computed from individual confidences)
+        # Apply confidence filter
         # FR9: Search Result Ranking - aggregate confidence is product of
-        # detection confidence and attribute classification confidences
-        # Using geometric mean of available confidences for balanced filtering
-        filters.append(
-            Detection.detection_confidence *
-            func.coalesce(Attribute.upper_color_confidence, 1.0) *
-            func.coalesce(Attribute.lower_color_confidence, 1.0) *
-            func.coalesce(Attribute.gender_confidence, 1.0) >= min_confidence
-        )
+        # detection confidence and attribute classification confidences,
+        # stored at insert time in the indexed search_confidence column
+        filters.append(Attribute.search_confidence >= bindparam("min_confidence"))
 
-        if filters:
-            query = query.filter(and_(*filters))
-
-        # Get total count before pagination
-        total_count = query.count()
+        statement = statement.where(and_(*filters))
 
         # Apply sorting
         # FR9: Sort by product of detection and attribute confidences
         if sort_by == "confidence":
-            sort_expr = (
-                Detection.detection_confidence *
-                func.coalesce(Attribute.upper_color_confidence, 1.0) *
-                func.coalesce(Attribute.lower_color_confidence, 1.0) *
-                func.coalesce(Attribute.gender_confidence, 1.0)
-            )
+            sort_expr = Attribute.search_confidence
         else:  # timestamp
             sort_expr = Detection.timestamp_in_video
 
         if sort_order == "desc":
-            query = query.order_by(desc(sort_expr))
+            statement = statement.order_by(desc(sort_expr))
         else:
-            query = query.order_by(asc(sort_expr))
+            statement = statement.order_by(asc(sort_expr))
 
         # Apply pagination
-        query = query.offset(offset).limit(limit)
-
-        # Execute query
-        results = query.all()
-
-        # Transform to response schema
-        items = []
-        for detection, attribute, video in results:
-            # FR9: Aggregate confidence is product of detection and attribute confidences
-            aggregate_conf = (
-                detection.detection_confidence *
-                (attribute.upper_color_confidence or 1.0) *
-                (attribute.lower_color_confidence or 1.0) *
-                (attribute.gender_confidence or 1.0)
-            )
-
-            items.append(SearchResultItem(
-                detection_id=detection.detection_id,
-                video_id=detection.video_id,
-                video_filename=video.filename,
-                frame_number=detection.frame_number,
-                timestamp_in_video=detection.timestamp_in_video,
-                bbox_x=detection.bbox_x,
-                bbox_y=detection.bbox_y,
-                bbox_width=detection.bbox_width,
-                bbox_height=detection.bbox_height,
-                detection_confidence=detection.detection_confidence,
-                person_crop_path=detection.person_crop_path,
-                upper_color=attribute.upper_color,
-                upper_color_confidence=attribute.upper_color_confidence,
-                lower_color=attribute.lower_color,
-                lower_color_confidence=attribute.lower_color_confidence,
-                gender=attribute.gender,
-                gender_confidence=attribute.gender_confidence,
-                aggregate_confidence=round(aggregate_conf, 3),
-            ))
-
-        logger.info(f"Search returned {len(items)} results (total: {total_count})")
-        return items, total_count
+        return statement.offset(bindparam("offset")).limit(bindparam("limit"))
 
     def search_advanced(self, query: AdvancedSearchQuery) -> tuple[list[SearchResultItem], int]:
         """
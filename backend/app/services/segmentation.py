@@ -5,14 +5,25 @@ This module provides a stub implementation for walkable region segmentation.
 TODO FYP2: Replace with DeepLabv3+ or similar semantic segmentation model.
 """
 import os
+from functools import cache
 from typing import Optional
 
+import cv2
 import numpy as np
 from loguru import logger
-from PIL import Image
 
 from app.core.config import settings
 
+# Masks are binary: 1-bit PNG at low compression effort
+_MASK_PNG_PARAMS = [cv2.IMWRITE_PNG_BILEVEL, 1, cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
+@cache
+def _ensure_dir(path: str) -> str:
+    """Create a directory once per process; later calls skip the makedirs syscall."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
 
 class SegmentationService:
     """Walkable region segmentation service using DeepLabv3+ (STUB)."""
@@ -23,6 +34,10 @@ class SegmentationService:
         TODO FYP2: Load actual segmentation model for mask generation.
         """
         self.model_name = "deeplabv3_resnet50"
+        # Last (mask, weight map) pair used by apply_mask; holding the mask keeps identity valid
+        self._weight_cache: Optional[tuple[np.ndarray, np.ndarray]] = None
+        # The stub mask depends only on frame size, so build it once per (height, width)
+        self._mask_cache: dict[tuple[int, int], tuple[np.ndarray, float]] = {}
         self._initialized = True
         logger.info(f"STUB: Segmentation service initialized with {self.model_name}")
 
@@ -31,6 +46,9 @@ class SegmentationService:
         STUB: Generate mock walkable region mask.
         Creates a simple mask representing pedestrian areas.
 
+        The returned mask is cached per frame size and read-only; callers
+        that need to modify it must take a .copy().
+
         Args:
             frame: Input frame as numpy array (H, W, C)
 
@@ -38,6 +56,10 @@ class SegmentationService:
             Tuple of (mask array, reduction percentage)
         """
         height, width = frame.shape[:2]
+        cached = self._mask_cache.get((height, width))
+        if cached is not None:
+            return cached
+
         mask = np.zeros((height, width), dtype=np.uint8)
 
         # Simple rectangular walkable region (bottom 60% of frame, center 70%)
@@ -48,13 +70,16 @@ class SegmentationService:
 
         mask[y_start:y_end, x_start:x_end] = 255
 
-        # Calculate area reduction
+        # Calculate area reduction from the rectangle itself (no pass over the mask)
         total_pixels = height * width
-        walkable_pixels = np.count_nonzero(mask)
+        walkable_pixels = (y_end - y_start) * (x_end - x_start)
         reduction_pct = ((total_pixels - walkable_pixels) / total_pixels) * 100
 
         logger.info(f"STUB: Generated mask with {reduction_pct:.1f}% area reduction")
-        return mask, round(reduction_pct, 2)
+        mask.setflags(write=False)
+        result = (mask, round(reduction_pct, 2))
+        self._mask_cache[(height, width)] = result
+        return result
 
     def save_mask(
         self,
@@ -76,31 +101,43 @@ class SegmentationService:
         if filename is None:
             filename = f"mask_camera_{camera_id}.png"
 
-        mask_dir = os.path.join(settings.UPLOAD_DIR, "masks")
-        os.makedirs(mask_dir, exist_ok=True)
+        mask_dir = _ensure_dir(os.path.join(settings.UPLOAD_DIR, "masks"))
 
         mask_path = os.path.join(mask_dir, filename)
-        Image.fromarray(mask).save(mask_path)
+        if not cv2.imwrite(mask_path, mask, _MASK_PNG_PARAMS):
+            raise OSError(f"Failed to write mask to {mask_path}")
 
         logger.info(f"Saved segmentation mask to {mask_path}")
         return mask_path
 
-    def apply_mask(self, frame: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    def _weight_map(self, frame: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Return a uint8 per-pixel weight (255 keep, 77 ~= 0.3 darken) shaped like frame."""
+        cached = self._weight_cache
+        if cached is not None and cached[0] is mask and cached[1].shape == frame.shape:
+            return cached[1]
+
+        weight = np.where(mask != 0, np.uint8(255), np.uint8(77))
+        if frame.ndim == 3:
+            weight = np.repeat(weight[..., None], frame.shape[2], axis=2)
+        self._weight_cache = (mask, weight)
+        return weight
+
+    def apply_mask(
+        self, frame: np.ndarray, mask: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Apply mask to frame for visualization.
 
         Args:
             frame: Input frame
             mask: Binary mask
+            out: Optional preallocated output buffer shaped like frame
 
         Returns:
             Frame with mask overlay
         """
-        # Create colored overlay
-        overlay = frame.copy()
-        overlay[mask == 0] = (overlay[mask == 0] * 0.3).astype(np.uint8)  # Darken non-walkable
-
-        return overlay
+        # Darken non-walkable pixels with one saturating uint8 multiply (frame * w / 255)
+        return cv2.multiply(frame, self._weight_map(frame, mask), dst=out, scale=1 / 255.0)
 
 
 # Global singleton instance
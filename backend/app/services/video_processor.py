@@ -6,9 +6,13 @@ TODO FYP2: Replace stub implementations with actual model inference.
 """
 import asyncio
 import os
+import queue
 import random
+import threading
 import time
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 import cv2
 import numpy as np
@@ -17,14 +21,142 @@ from PIL import Image
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.models import Attribute, Detection, PerformanceMetric, Video
+from app.models import Attribute, Detection, PerformanceMetric, TriggeredAlert, Video
+from app.models.attribute import compute_search_confidence
 from app.services.detector import get_detector
 from app.services.attribute_classifier import get_attribute_classifier
+from app.utils.image_utils import save_image
+
+try:
+    import torch
+    from torchcodec.decoders import VideoDecoder
+except ImportError:  # Optional NVDEC decode backend
+    torch = None
+    VideoDecoder = None
+
+
+def _sample_frames(
+    cap: cv2.VideoCapture, frame_interval: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Yield (frame_number, frame) for every frame_interval-th frame.
+
+    Decodes sequentially: grab() advances past skipped frames without
+    converting them, and only sampled frames are retrieved. Seeking to each
+    sample instead re-decodes from the previous keyframe every time.
+    """
+    frame_num = -1
+    while cap.grab():
+        frame_num += 1
+        if frame_num % frame_interval:
+            continue
+
+        ret, frame = cap.retrieve()
+        if ret:
+            yield frame_num, frame
+
+
+def _sample_frames_torchcodec(
+    file_path: str, frame_interval: int, chunk_size: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Yield (frame_number, frame) for every frame_interval-th frame via torchcodec.
+
+    On a CUDA device frames are decoded by NVDEC, and each chunk of sampled
+    indices is fetched with one get_frames_at call, which orders the decode
+    by GOP instead of seeking per frame.
+    """
+    device = settings.VIDEO_DECODE_DEVICE
+    if device == "auto":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    decoder = VideoDecoder(file_path, device=device)
+    # Sample indices are fixed up front so decoding never seeks frame by frame
+    indices = list(range(0, len(decoder), frame_interval))
+    for start in range(0, len(indices), chunk_size):
+        chunk = indices[start:start + chunk_size]
+        frames = decoder.get_frames_at(indices=chunk).data  # (N, C, H, W) RGB uint8
+        # TODO FYP2: pass the device tensors to the detector; the stubs take host BGR arrays
+        host_frames = frames.permute(0, 2, 3, 1).flip(-1).contiguous().cpu().numpy()
+        yield from zip(chunk, host_frames)
+
+
+# End-of-stream marker for the reader thread queue
+_END = object()
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put into a bounded queue, giving up once stop is set. Returns whether it was queued."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_batches(
+    frames: Iterable[tuple[int, np.ndarray]],
+    batch_size: int,
+    out: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Reader thread: decode sampled frames and queue them in inference batches."""
+    try:
+        for batch in _batched(frames, batch_size):
+            if not _put(out, batch, stop):
+                return
+        _put(out, _END, stop)
+    except Exception as e:
+        # Re-raised by the consumer
+        _put(out, e, stop)
+
+
+def _write_crop(crop_path: str, person_crop: np.ndarray) -> None:
+    """Encode and save one person crop, logging instead of raising on failure."""
+    try:
+        # The crops directory is created before processing starts
+        save_image(person_crop, crop_path, settings.CROP_JPEG_QUALITY, make_dirs=False)
+    except (OSError, cv2.error) as e:
+        logger.warning(f"Failed to write crop {crop_path}: {e}")
+
+
+def _submit_crop(
+    pool: ThreadPoolExecutor,
+    slots: threading.BoundedSemaphore,
+    crop_path: str,
+    person_crop: np.ndarray,
+) -> None:
+    """Hand a crop to the write pool, blocking while the backlog is full."""
+    slots.acquire()
+    future = pool.submit(_write_crop, crop_path, person_crop)
+    future.add_done_callback(lambda _: slots.release())
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Group items into lists of at most size, preserving order."""
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 class VideoProcessor:
     """Video processing orchestrator with detection and attribute extraction."""
 
+    # Decoded batches buffered ahead of inference
+    READ_AHEAD_BATCHES = 2
+
+    # Threads encoding and saving crops; JPEG encode and file writes release the GIL
+    CROP_WRITE_WORKERS = 4
+
+    # Crops submitted but not yet written; bounds memory if disk falls behind
+    CROP_WRITE_QUEUE_SIZE = 256
+
     def __init__(self, db: Session) -> None:
         """
         Initialize video processor.
@@ -33,8 +165,121 @@ class VideoProcessor:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.detector = get_detector()
-        self.classifier = get_attribute_classifier()
+        # Processors are created per request; the models behind them are per process
+        self.detector = get_detector(settings.INFERENCE_PRECISION, settings.INFERENCE_ENGINE)
+        self.classifier = get_attribute_classifier(
+            settings.INFERENCE_PRECISION, settings.INFERENCE_ENGINE
+        )
+
+    def _process_batch(
+        self,
+        video_id: int,
+        fps: float,
+        crops_dir: str,
+        batch: list[tuple[int, np.ndarray]],
+        write_crop: Callable[[str, np.ndarray], None],
+        scale: float = 1.0,
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        Detect and classify the persons in a batch of sampled frames.
+
+        Args:
+            video_id: Video the frames belong to
+            fps: Video frame rate
+            crops_dir: Directory for person crop images
+            batch: (frame_number, frame) tuples
+            write_crop: Schedules a (path, crop) pair for writing
+            scale: Resize factor applied to frames before detection
+
+        Returns:
+            Tuple of (detection rows, attribute rows without detection_id), in the same order
+        """
+        frame_numbers = [frame_num for frame_num, _ in batch]
+        frames = [frame for _, frame in batch]
+
+        # Detect on frames shrunk toward the model input size; the detector would
+        # resize them anyway, and crops are still cut from the full-resolution frame
+        if scale < 1.0:
+            detector_frames = [
+                cv2.resize(
+                    frame,
+                    (int(frame.shape[1] * scale), int(frame.shape[0] * scale)),
+                    interpolation=cv2.INTER_AREA,
+                )
+                for frame in frames
+            ]
+        else:
+            detector_frames = frames
+
+        # Detect persons in all frames with one call (STUB), mapped back to full
+        # resolution and clamped to each decoded frame's own bounds (container
+        # header dimensions can disagree with the frames actually decoded)
+        detections = [
+            frame_detections.rescale(1 / scale).clip(frame.shape[1], frame.shape[0])
+            for frame, frame_detections in zip(
+                frames,
+                self.detector.detect_batch(detector_frames, frame_numbers=frame_numbers),
+            )
+        ]
+
+        # Gather crops across the batch and classify them with one call (STUB).
+        # Boxes are already clipped, so this is exactly one crop (a view) per detection
+        crops = [
+            frame[y:y + h, x:x + w]
+            for frame, frame_detections in zip(frames, detections)
+            for x, y, w, h in frame_detections.bbox.tolist()
+        ]
+        attributes = self.classifier.classify_batch(crops) if crops else []
+
+        detection_rows: list[dict] = []
+        crop_index = 0
+        for frame_num, frame_detections in zip(frame_numbers, detections):
+            # Hand crop images to the write pool
+            crop_paths: list[str] = []
+            for det_idx in range(len(frame_detections)):
+                crop_filename = f"frame_{frame_num}_det_{det_idx}.jpg"
+                crop_path = os.path.join(crops_dir, crop_filename)
+                write_crop(crop_path, crops[crop_index])
+                crop_paths.append(crop_path)
+                crop_index += 1
+            detection_rows.extend(frame_detections.to_records(video_id, fps, crop_paths))
+
+        attribute_rows = [
+            {
+                "upper_color": attrs["upper_color"],
+                "upper_color_confidence": attrs["upper_color_confidence"],
+                "lower_color": attrs["lower_color"],
+                "lower_color_confidence": attrs["lower_color_confidence"],
+                "gender": attrs["gender"],
+                "gender_confidence": attrs["gender_confidence"],
+                "search_confidence": compute_search_confidence(
+                    row["detection_confidence"],
+                    attrs["upper_color_confidence"],
+                    attrs["lower_color_confidence"],
+                    attrs["gender_confidence"],
+                ),
+            }
+            for row, attrs in zip(detection_rows, attributes)
+        ]
+
+        return detection_rows, attribute_rows
+
+    def _insert_rows(self, detection_rows: list[dict], attribute_rows: list[dict]) -> list[int]:
+        """
+        Insert staged detections and their attributes in two statements.
+
+        Args:
+            detection_rows: Detection column mappings
+            attribute_rows: Attribute mappings matching detection_rows by position
+
+        Returns:
+            IDs of the inserted detections
+        """
+        detection_ids = Detection.bulk_insert(self.db, detection_rows)
+        for attribute_row, detection_id in zip(attribute_rows, detection_ids):
+            attribute_row["detection_id"] = detection_id
+        Attribute.bulk_insert(self.db, attribute_rows)
+        return detection_ids
 
     async def process_video(
         self,
@@ -63,10 +308,6 @@ class VideoProcessor:
 
         logger.info(f"Starting processing for video {video_id}: {video.filename}")
 
-        # Update status to processing
-        video.processing_status = "processing"
-        self.db.commit()
-
         try:
             # Open video file
             cap = cv2.VideoCapture(video.file_path)
@@ -80,7 +321,8 @@ class VideoProcessor:
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             duration = frame_count / fps if fps > 0 else 0
 
-            # Update video metadata
+            # Mark processing and record metadata in one commit
+            video.processing_status = "processing"
             video.fps = fps
             video.total_frames = frame_count
             video.resolution = f"{width}x{height}"
@@ -102,89 +344,96 @@ class VideoProcessor:
             frame_interval = max(1, settings.ATTRIBUTE_INTERVAL_FRAMES)
             total_detections = 0
             processed_frames = 0
+            detection_ids: list[int] = []
+
+            # Rows staged across batches and inserted DB_INSERT_BATCH_ROWS at a time
+            pending_detections: list[dict] = []
+            pending_attributes: list[dict] = []
+
+            # Sampled frames go through the detector and classifier in batches
+            batch_size = max(1, settings.INFERENCE_BATCH_SIZE)
+
+            # Frames are downscaled once so their long side matches the detector input
+            detect_scale = min(1.0, max(self.detector.INPUT_SIZE) / max(width, height, 1))
+
+            if settings.VIDEO_DECODER == "torchcodec" and VideoDecoder is not None:
+                sampled_frames = _sample_frames_torchcodec(
+                    video.file_path, frame_interval, batch_size
+                )
+            else:
+                if settings.VIDEO_DECODER == "torchcodec":
+                    logger.warning("torchcodec is not installed; decoding with OpenCV")
+                sampled_frames = _sample_frames(cap, frame_interval)
+
+            # Three stages overlap: a reader thread decodes, inference runs in a
+            # worker thread (keeping the event loop free), a thread pool saves crops
+            read_queue: queue.Queue = queue.Queue(maxsize=self.READ_AHEAD_BATCHES)
+            stop_reading = threading.Event()
+            reader = threading.Thread(
+                target=_read_batches,
+                args=(sampled_frames, batch_size, read_queue, stop_reading),
+                name=f"video-{video_id}-reader",
+                daemon=True,
+            )
+            crop_pool = ThreadPoolExecutor(
+                max_workers=self.CROP_WRITE_WORKERS, thread_name_prefix=f"video-{video_id}-crops"
+            )
+            write_crop = partial(
+                _submit_crop, crop_pool, threading.BoundedSemaphore(self.CROP_WRITE_QUEUE_SIZE)
+            )
+            reader.start()
 
-            for frame_num in range(0, frame_count, frame_interval):
-                # Read frame
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-                ret, frame = cap.read()
-                if not ret:
-                    continue
-
-                processed_frames += 1
-                timestamp = frame_num / fps
-
-                # Detect persons in frame (STUB)
-                detections = self.detector.detect_persons(frame)
-
-                # Process each detection
-                for det_idx, det in enumerate(detections):
-                    bbox = det["bbox"]
-                    x, y, w, h = bbox
-
-                    # Ensure bbox is within frame bounds
-                    x = max(0, min(x, width - 1))
-                    y = max(0, min(y, height - 1))
-                    w = min(w, width - x)
-                    h = min(h, height - y)
-
-                    if w <= 0 or h <= 0:
-                        continue
-
-                    # Extract person crop
-                    person_crop = frame[y:y+h, x:x+w]
-
-                    # Save crop image
-                    crop_filename = f"frame_{frame_num}_det_{det_idx}.jpg"
-                    crop_path = os.path.join(crops_dir, crop_filename)
-                    cv2.imwrite(crop_path, person_crop)
-
-                    # Classify attributes (STUB)
-                    attributes = self.classifier.classify_attributes(person_crop)
-
-                    # Create detection record
-                    detection = Detection(
-                        video_id=video_id,
-                        frame_number=frame_num,
-                        timestamp_in_video=timestamp,
-                        bbox_x=x,
-                        bbox_y=y,
-                        bbox_width=w,
-                        bbox_height=h,
-                        detection_confidence=det["confidence"],
-                        person_crop_path=crop_path,
-                    )
-                    self.db.add(detection)
-                    self.db.flush()  # Get detection_id
-
-                    # Create attribute record
-                    attribute = Attribute(
-                        detection_id=detection.detection_id,
-                        upper_color=attributes["upper_color"],
-                        upper_color_confidence=attributes["upper_color_confidence"],
-                        lower_color=attributes["lower_color"],
-                        lower_color_confidence=attributes["lower_color_confidence"],
-                        gender=attributes["gender"],
-                        gender_confidence=attributes["gender_confidence"],
+            try:
+                while (batch := await asyncio.to_thread(read_queue.get)) is not _END:
+                    if isinstance(batch, Exception):
+                        raise batch
+
+                    processed_frames += len(batch)
+                    frame_num = batch[-1][0]
+
+                    detection_rows, attribute_rows = await asyncio.to_thread(
+                        self._process_batch,
+                        video_id, fps, crops_dir, batch, write_crop,
+                        detect_scale,
                     )
-                    self.db.add(attribute)
-                    total_detections += 1
-
-                # Send progress update
-                progress = (frame_num / frame_count) * 100
-                if progress_callback:
-                    progress_callback({
-                        "video_id": video_id,
-                        "status": "processing",
-                        "progress": round(progress, 1),
-                        "current_frame": frame_num,
-                        "total_frames": frame_count,
-                        "detections_count": total_detections,
-                    })
-
-                # Small delay to simulate processing time
-                await asyncio.sleep(0.01)
-
-            cap.release()
+                    pending_detections.extend(detection_rows)
+                    pending_attributes.extend(attribute_rows)
+                    total_detections += len(detection_rows)
+
+                    if len(pending_detections) >= settings.DB_INSERT_BATCH_ROWS:
+                        detection_ids.extend(await asyncio.to_thread(
+                            self._insert_rows, pending_detections, pending_attributes
+                        ))
+                        pending_detections, pending_attributes = [], []
+
+                    # Send progress update
+                    # CAP_PROP_FRAME_COUNT is a container estimate; keep progress within 0-100
+                    progress = min(frame_num / frame_count * 100, 100) if frame_count else 0
+                    if progress_callback:
+                        progress_callback({
+                            "video_id": video_id,
+                            "status": "processing",
+                            "progress": round(progress, 1),
+                            "current_frame": frame_num,
+                            "total_frames": frame_count,
+                            "detections_count": total_detections,
+                        })
+
+                if pending_detections:
+                    detection_ids.extend(await asyncio.to_thread(
+                        self._insert_rows, pending_detections, pending_attributes
+                    ))
+            finally:
+                stop_reading.set()
+                await asyncio.to_thread(reader.join)
+                cap.release()
+                # Let submitted crops finish writing before the video is reported done
+                await asyncio.to_thread(crop_pool.shutdown, wait=True)
+
+            # UR5: Evaluate alert rules against all new detections in one statement
+            alerts_triggered = TriggeredAlert.bulk_match(self.db, detection_ids)
+            if alerts_triggered:
+                logger.info(f"Video {video_id} triggered {alerts_triggered} alerts")
 
             # Calculate processing time
             processing_time = time.time() - start_time
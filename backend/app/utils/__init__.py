@@ -18,6 +18,8 @@ from app.utils.video_utils import (
 from app.utils.image_utils import (
     resize_image,
     crop_image,
+    clip_boxes,
+    crop_boxes,
     draw_bounding_box,
     save_image,
     load_image,
@@ -41,6 +43,8 @@ __all__ = [
     # Image utils
     "resize_image",
     "crop_image",
+    "clip_boxes",
+    "crop_boxes",
     "draw_bounding_box",
     "save_image",
     "load_image",
@@ -1,4 +1,6 @@
 """File handling utilities."""
+import asyncio
+import io
 import os
 import shutil
 from typing import BinaryIO
@@ -11,8 +13,18 @@ from loguru import logger
 from app.core.config import settings
 
 
-ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv"}
-ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif"}
+ALLOWED_VIDEO_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv"})
+ALLOWED_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".gif"})
+
+# Dotless forms, matched against str.rpartition output without building a suffix string
+_VIDEO_EXTS_NO_DOT = frozenset(ext.lstrip(".") for ext in ALLOWED_VIDEO_EXTENSIONS)
+_IMAGE_EXTS_NO_DOT = frozenset(ext.lstrip(".") for ext in ALLOWED_IMAGE_EXTENSIONS)
+
+# Upload copy chunk, in line with typical filesystem read-ahead
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Spooled uploads above this size are copied in kernel space instead of through Python
+KERNEL_COPY_MIN_BYTES = 64 * 1024 * 1024
 
 
 def get_file_extension(filename: str) -> str:
@@ -22,12 +34,14 @@ def get_file_extension(filename: str) -> str:
 
 def is_valid_video(filename: str) -> bool:
     """Check if file is a valid video format."""
-    return get_file_extension(filename) in ALLOWED_VIDEO_EXTENSIONS
+    _, dot, ext = filename.rpartition(".")
+    return bool(dot) and ext.lower() in _VIDEO_EXTS_NO_DOT
 
 
 def is_valid_image(filename: str) -> bool:
     """Check if file is a valid image format."""
-    return get_file_extension(filename) in ALLOWED_IMAGE_EXTENSIONS
+    _, dot, ext = filename.rpartition(".")
+    return bool(dot) and ext.lower() in _IMAGE_EXTS_NO_DOT
 
 
 def generate_unique_filename(original_filename: str) -> str:
@@ -40,6 +54,44 @@ def generate_unique_filename(original_filename: str) -> str:
     return f"{safe_base}_{unique_id}{ext}"
 
 
+def _spooled_fd(upload_file: UploadFile) -> int | None:
+    """Return the OS file descriptor behind an upload once it has spilled to disk."""
+    src = upload_file.file
+    # SpooledTemporaryFile.fileno() forces a rollover, so leave in-memory uploads alone
+    if not getattr(src, "_rolled", True):
+        return None
+    try:
+        return src.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _kernel_copy(src_fd: int, file_path: str, offset: int, count: int) -> None:
+    """
+    Copy count bytes from src_fd at offset into a new file without a user-space buffer.
+
+    Uses os.copy_file_range (reflink-capable on XFS/Btrfs) and falls back to
+    os.sendfile where the kernel or filesystem pair does not support it.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    with open(file_path, "wb") as dst:
+        dst_fd = dst.fileno()
+        while count > 0:
+            size = min(count, UPLOAD_CHUNK_SIZE)
+            if copy_range is not None:
+                try:
+                    copied = copy_range(src_fd, dst_fd, size, offset)
+                except OSError:
+                    copy_range = None
+                    continue
+            else:
+                copied = os.sendfile(dst_fd, src_fd, offset, size)
+            if copied == 0:
+                break
+            offset += copied
+            count -= copied
+
+
 async def save_upload_file(
     upload_file: UploadFile,
     destination_dir: str,
@@ -63,8 +115,17 @@ async def save_upload_file(
 
     file_path = os.path.join(destination_dir, filename)
 
+    src_fd = _spooled_fd(upload_file)
+    if src_fd is not None:
+        offset = upload_file.file.tell()
+        remaining = os.fstat(src_fd).st_size - offset
+        if remaining > KERNEL_COPY_MIN_BYTES:
+            await asyncio.to_thread(_kernel_copy, src_fd, file_path, offset, remaining)
+            logger.info(f"Saved uploaded file to {file_path}")
+            return file_path
+
     async with aiofiles.open(file_path, "wb") as buffer:
-        while chunk := await upload_file.read(1024 * 1024):  # 1MB chunks
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
             await buffer.write(chunk)
 
     logger.info(f"Saved uploaded file to {file_path}")
@@ -82,14 +143,14 @@ def delete_file(file_path: str) -> bool:
         True if deleted, False otherwise
     """
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.info(f"Deleted file: {file_path}")
-            return True
+        os.remove(file_path)
+    except FileNotFoundError:
         return False
-    except Exception as e:
+    except OSError as e:
         logger.error(f"Error deleting file {file_path}: {e}")
         return False
+    logger.info(f"Deleted file: {file_path}")
+    return True
 
 
 def delete_directory(dir_path: str) -> bool:
@@ -103,14 +164,14 @@ def delete_directory(dir_path: str) -> bool:
         True if deleted, False otherwise
     """
     try:
-        if os.path.exists(dir_path):
-            shutil.rmtree(dir_path)
-            logger.info(f"Deleted directory: {dir_path}")
-            return True
+        shutil.rmtree(dir_path)
+    except FileNotFoundError:
         return False
-    except Exception as e:
+    except OSError as e:
         logger.error(f"Error deleting directory {dir_path}: {e}")
         return False
+    logger.info(f"Deleted directory: {dir_path}")
+    return True
 
 
 def get_file_size_mb(file_path: str) -> float:
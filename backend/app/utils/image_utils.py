@@ -7,6 +7,16 @@ import numpy as np
 from PIL import Image
 from loguru import logger
 
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+    _turbo_jpeg: Any = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # PyTurboJPEG or libturbojpeg unavailable
+    _turbo_jpeg = None
+
+# cv2.getTextSize results for overlay labels, which come from a small attribute vocabulary
+_TEXT_SIZE_CACHE: dict[tuple[str, int, float], tuple[tuple[int, int], int]] = {}
+_TEXT_SIZE_CACHE_MAX = 256
+
 
 def resize_image(
     image: np.ndarray,
@@ -34,7 +44,15 @@ def resize_image(
     new_width = int(width * scale)
     new_height = int(height * scale)
 
-    return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+    if scale >= 0.5:
+        return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+
+    # Large reductions: halve with the fixed 2x2 pyramid filter while that stays
+    # above the target, then finish the remaining (< 2x) step bilinearly
+    while (width + 1) // 2 >= new_width and (height + 1) // 2 >= new_height:
+        image = cv2.pyrDown(image)
+        height, width = image.shape[:2]
+    return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
 
 
 def crop_image(
@@ -68,6 +86,59 @@ def crop_image(
     return image[y:y2, x:x2]
 
 
+def clip_boxes(
+    boxes: np.ndarray, width: int, height: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clamp (N, 4) x/y/width/height boxes to image bounds in one vectorized pass.
+
+    Args:
+        boxes: Integer boxes, one row per box
+        width: Image width
+        height: Image height
+
+    Returns:
+        Tuple of (clamped copy of boxes, boolean mask of boxes with positive area)
+    """
+    clipped = boxes.copy()
+    clipped[:, 0] = np.clip(clipped[:, 0], 0, width - 1)
+    clipped[:, 1] = np.clip(clipped[:, 1], 0, height - 1)
+    clipped[:, 2] = np.minimum(clipped[:, 2], width - clipped[:, 0])
+    clipped[:, 3] = np.minimum(clipped[:, 3], height - clipped[:, 1])
+    keep = (clipped[:, 2] > 0) & (clipped[:, 3] > 0)
+    return clipped, keep
+
+
+def crop_boxes(image: np.ndarray, boxes: np.ndarray) -> list[np.ndarray]:
+    """
+    Crop several regions from an image.
+
+    Boxes are clamped to the image and empty ones dropped. Crops are views
+    into image, not copies; encoding or copying them is what materializes pixels.
+
+    Args:
+        image: Input image
+        boxes: (N, 4) integer x/y/width/height boxes
+
+    Returns:
+        Cropped views for the boxes that remain non-empty, in order
+    """
+    img_height, img_width = image.shape[:2]
+    clipped, keep = clip_boxes(boxes, img_width, img_height)
+    return [image[y:y + h, x:x + w] for x, y, w, h in clipped[keep].tolist()]
+
+
+def _text_size(label: str, font: int, font_scale: float) -> tuple[tuple[int, int], int]:
+    """Memoized cv2.getTextSize for thickness 1, evicting the oldest entry when full."""
+    key = (label, font, font_scale)
+    size = _TEXT_SIZE_CACHE.get(key)
+    if size is None:
+        if len(_TEXT_SIZE_CACHE) >= _TEXT_SIZE_CACHE_MAX:
+            del _TEXT_SIZE_CACHE[next(iter(_TEXT_SIZE_CACHE))]
+        size = _TEXT_SIZE_CACHE[key] = cv2.getTextSize(label, font, font_scale, 1)
+    return size
+
+
 def draw_bounding_box(
     image: np.ndarray,
     x: int,
@@ -77,10 +148,14 @@ def draw_bounding_box(
     color: tuple[int, int, int] = (0, 255, 0),
     thickness: int = 2,
     label: str | None = None,
+    inplace: bool = False,
 ) -> np.ndarray:
     """
     Draw a bounding box on an image.
 
+    To stack several boxes on one frame, copy it once (if the original must
+    be kept) and call with inplace=True for each box.
+
     Args:
         image: Input image
         x: Left coordinate
@@ -90,20 +165,19 @@ def draw_bounding_box(
         color: BGR color tuple
         thickness: Line thickness
         label: Optional text label
+        inplace: Draw on image itself instead of a copy (mutates the input)
 
     Returns:
         Image with bounding box drawn
     """
-    result = image.copy()
+    result = image if inplace else image.copy()
     cv2.rectangle(result, (x, y), (x + width, y + height), color, thickness)
 
     if label:
         # Draw label background
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.5
-        (text_width, text_height), baseline = cv2.getTextSize(
-            label, font, font_scale, 1
-        )
+        (text_width, text_height), baseline = _text_size(label, font, font_scale)
         cv2.rectangle(
             result,
             (x, y - text_height - 10),
@@ -124,22 +198,37 @@ def draw_bounding_box(
     return result
 
 
-def save_image(image: np.ndarray, path: str, quality: int = 90) -> str:
+def save_image(
+    image: np.ndarray, path: str, quality: int = 90, make_dirs: bool = True
+) -> str:
     """
     Save image to file.
 
+    BGR JPEGs are encoded with libjpeg-turbo when PyTurboJPEG is installed,
+    falling back to OpenCV otherwise.
+
     Args:
         image: Image as numpy array
         path: Output file path
         quality: JPEG quality (0-100)
+        make_dirs: Create the parent directory first; skip when it is known to exist
 
     Returns:
         Path to saved file
     """
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if make_dirs:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
 
     if path.lower().endswith(('.jpg', '.jpeg')):
-        cv2.imwrite(path, image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if _turbo_jpeg is not None and image.ndim == 3:
+            # Crops are strided views into a frame; the encoder needs contiguous rows
+            encoded = _turbo_jpeg.encode(
+                np.ascontiguousarray(image), quality=quality, pixel_format=TJPF_BGR
+            )
+            with open(path, "wb") as f:
+                f.write(encoded)
+        else:
+            cv2.imwrite(path, image, [cv2.IMWRITE_JPEG_QUALITY, quality])
     else:
         cv2.imwrite(path, image)
 
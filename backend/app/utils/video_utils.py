@@ -4,41 +4,78 @@ from typing import Any
 import cv2
 from loguru import logger
 
+try:
+    import av
+except ImportError:  # PyAV missing; probe through OpenCV instead
+    av = None
+
 
 def get_video_metadata(file_path: str) -> dict[str, Any]:
     """
     Extract metadata from a video file.
 
+    With PyAV installed this reads the container header only, without
+    initializing a decoder; otherwise it falls back to OpenCV.
+
     Args:
         file_path: Path to the video file
 
     Returns:
         Dictionary with video metadata
     """
+    if av is not None:
+        fps, frame_count, width, height = _probe_header(file_path)
+    else:
+        fps, frame_count, width, height = _probe_capture(file_path)
+    duration = frame_count / fps if fps > 0 else 0
+
+    metadata = {
+        "fps": round(fps, 2),
+        "total_frames": frame_count,
+        "width": width,
+        "height": height,
+        "resolution": f"{width}x{height}",
+        "duration_seconds": round(duration, 2),
+    }
+
+    logger.debug(f"Video metadata for {file_path}: {metadata}")
+    return metadata
+
+
+def _probe_header(file_path: str) -> tuple[float, int, int, int]:
+    """Read (fps, frame_count, width, height) from the container header with PyAV."""
+    try:
+        container = av.open(file_path)
+    except av.error.FFmpegError as e:
+        raise ValueError(f"Cannot open video file: {file_path}") from e
+
+    with container:
+        if not container.streams.video:
+            raise ValueError(f"No video stream in file: {file_path}")
+        stream = container.streams.video[0]
+        rate = stream.average_rate or stream.guessed_rate
+        fps = float(rate) if rate else 0.0
+        frame_count = stream.frames
+        if not frame_count and container.duration and fps > 0:
+            # Some containers (e.g. MKV) carry no frame count; estimate it like OpenCV does
+            frame_count = int(container.duration / av.time_base * fps)
+        return fps, frame_count, stream.codec_context.width, stream.codec_context.height
+
+
+def _probe_capture(file_path: str) -> tuple[float, int, int, int]:
+    """Read (fps, frame_count, width, height) through cv2.VideoCapture."""
     cap = cv2.VideoCapture(file_path)
 
     if not cap.isOpened():
         raise ValueError(f"Cannot open video file: {file_path}")
 
     try:
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        duration = frame_count / fps if fps > 0 else 0
-
-        metadata = {
-            "fps": round(fps, 2),
-            "total_frames": frame_count,
-            "width": width,
-            "height": height,
-            "resolution": f"{width}x{height}",
-            "duration_seconds": round(duration, 2),
-        }
-
-        logger.debug(f"Video metadata for {file_path}: {metadata}")
-        return metadata
-
+        return (
+            cap.get(cv2.CAP_PROP_FPS),
+            int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
     finally:
         cap.release()
 
@@ -72,6 +109,18 @@ def extract_frame(file_path: str, frame_number: int) -> Any:
         cap.release()
 
 
+def _first_frame(file_path: str) -> Any:
+    """Decode only the first video frame with PyAV, as a BGR numpy array."""
+    try:
+        with av.open(file_path) as container:
+            frame = next(container.decode(video=0), None)
+            if frame is None:
+                raise ValueError(f"Cannot read frame 0 from {file_path}")
+            return frame.to_ndarray(format="bgr24")
+    except av.error.FFmpegError as e:
+        raise ValueError(f"Cannot open video file: {file_path}") from e
+
+
 def extract_thumbnail(file_path: str, output_path: str, target_frame: int = 0) -> str:
     """
     Extract a thumbnail image from a video.
@@ -84,7 +133,10 @@ def extract_thumbnail(file_path: str, output_path: str, target_frame: int = 0) -
     Returns:
         Path to saved thumbnail
     """
-    frame = extract_frame(file_path, target_frame)
+    if target_frame == 0 and av is not None:
+        frame = _first_frame(file_path)
+    else:
+        frame = extract_frame(file_path, target_frame)
     cv2.imwrite(output_path, frame)
     logger.info(f"Saved thumbnail to {output_path}")
     return output_path
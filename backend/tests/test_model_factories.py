@@ -0,0 +1,32 @@
+"""Tests for the per-process detector and attribute classifier factories."""
+from app.core.config import settings
+from app.services.attribute_classifier import get_attribute_classifier
+from app.services.detector import get_detector
+
+
+def test_get_detector_returns_one_instance_per_process() -> None:
+    detector = get_detector()
+    assert get_detector() is detector
+    # Explicit arguments equal to the settings resolve to the same instance
+    assert get_detector(settings.INFERENCE_PRECISION, settings.INFERENCE_ENGINE) is detector
+
+
+def test_get_detector_caches_per_configuration() -> None:
+    fp16 = get_detector("fp16", "torch")
+    assert get_detector("fp16", "torch") is fp16
+    assert fp16 is not get_detector("fp32", "torch")
+    assert fp16.precision == "fp16"
+
+
+def test_get_attribute_classifier_returns_one_instance_per_process() -> None:
+    classifier = get_attribute_classifier()
+    assert get_attribute_classifier() is classifier
+    assert get_attribute_classifier(
+        settings.INFERENCE_PRECISION, settings.INFERENCE_ENGINE
+    ) is classifier
+
+
+def test_get_attribute_classifier_caches_per_configuration() -> None:
+    fp16 = get_attribute_classifier("fp16", "torch")
+    assert get_attribute_classifier("fp16", "torch") is fp16
+    assert fp16 is not get_attribute_classifier("fp32", "torch")
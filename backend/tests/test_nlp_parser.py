@@ -0,0 +1,67 @@
+"""Tests for the natural language query parser."""
+import pytest
+
+from app.services.nlp_parser import NLPParser
+
+
+@pytest.fixture
+def parser() -> NLPParser:
+    return NLPParser()
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("male wearing red shirt", {"gender": "male", "upper_color": "red", "lower_color": None}),
+        ("person with blue pants", {"gender": None, "upper_color": None, "lower_color": "blue"}),
+        (
+            "female with black top and white bottom",
+            {"gender": "female", "upper_color": "black", "lower_color": "white"},
+        ),
+    ],
+)
+def test_parse_query(parser: NLPParser, query: str, expected: dict) -> None:
+    assert parser.parse_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "upper_color", "lower_color"),
+    [
+        ("men in red shirts", "red", None),
+        ("people with black hoodies", "black", None),
+        ("man in white tops", "white", None),
+        ("women in black skirts", None, "black"),
+        ("navy tshirts and khaki shorts", "blue", "brown"),
+    ],
+)
+def test_plural_garments(
+    parser: NLPParser, query: str, upper_color: str | None, lower_color: str | None
+) -> None:
+    result = parser.parse_query(query)
+    assert result["upper_color"] == upper_color
+    assert result["lower_color"] == lower_color
+
+
+@pytest.mark.parametrize(
+    ("query", "upper_color", "lower_color"),
+    [
+        # Compound garments read the color after them
+        ("person a t-shirt in black", "black", None),
+        ("guy with tshirt gray", "gray", None),
+        # A later occurrence is used when the first has no word before it
+        ("skirt and black skirt", None, "black"),
+        # "wearing" fallback
+        ("woman wearing a green", "green", None),
+    ],
+)
+def test_keyword_positions(
+    parser: NLPParser, query: str, upper_color: str | None, lower_color: str | None
+) -> None:
+    result = parser.parse_query(query)
+    assert result["upper_color"] == upper_color
+    assert result["lower_color"] == lower_color
+
+
+def test_color_words_are_whole_tokens(parser: NLPParser) -> None:
+    # "topaz" is not the garment "top", and "redhead" is not the color "red"
+    assert parser.parse_query("topaz redhead")["upper_color"] is None